@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import requests
@@ -10,6 +12,11 @@ from gm_os.protocols import ProtocolId
 from llm.schemas import Intent, NarrationRequest, SessionSetup, TurnEnvelope
 
 
+_INTENT_TEMPERATURE = 0
+_INTENT_CACHE_SIZE = 128
+_UNCACHED_INTENTS = frozenset({"ask_clarifying_question", "invalid"})
+
+
 class LLMClientError(RuntimeError):
     pass
 
@@ -29,9 +36,22 @@ class OllamaClient:
         if timeout is None:
             timeout = int(os.getenv("OLLAMA_TIMEOUT", "30"))
         self.timeout = timeout
+        # One session per client: requests.Session is not thread-safe, but a
+        # client's calls within a turn still reuse the keep-alive connection.
+        self._http = requests.Session()
+        # Intent extraction runs at temperature 0, so the same text against the
+        # same prompt context yields the same Intent. The cache belongs to this
+        # client and is dropped with it; clients are built per request, so
+        # entries never carry over to another session.
+        self._intent_cache: OrderedDict[tuple[str, str, str], tuple[str, Intent]] = OrderedDict()
+        self._intent_cache_lock = threading.Lock()
 
     def extract_intent(self, player_text: str, context: dict | None = None) -> Intent:
         context_payload = context or {}
+        cache_key = self._intent_cache_key(player_text, context_payload)
+        cached = self._cached_intent(cache_key)
+        if cached is not None:
+            return cached[1]
         attempts = 0
         last_error: str | None = None
         while attempts < 3:
@@ -39,10 +59,11 @@ class OllamaClient:
             try:
                 content = self._chat(
                     messages=_intent_messages(player_text, context_payload, attempts, last_error),
-                    temperature=0,
+                    temperature=_INTENT_TEMPERATURE,
                     format="json",
                 )
                 intent = _parse_intent(content)
+                self._store_intent(cache_key, content, intent)
                 return intent
             except Exception as exc:
                 last_error = str(exc)
@@ -54,6 +75,18 @@ class OllamaClient:
         context: dict | None = None,
     ) -> tuple[Intent, dict]:
         context_payload = context or {}
+        cache_key = self._intent_cache_key(player_text, context_payload)
+        cached = self._cached_intent(cache_key)
+        if cached is not None:
+            content, intent = cached
+            return (
+                intent,
+                {
+                    "raw_llm_output": content,
+                    "parsed_intent": intent.model_dump(),
+                    "validation_errors": [],
+                },
+            )
         attempts = 0
         last_error: str | None = None
         last_output: str | None = None
@@ -63,11 +96,12 @@ class OllamaClient:
             try:
                 content = self._chat(
                     messages=_intent_messages(player_text, context_payload, attempts, last_error),
-                    temperature=0,
+                    temperature=_INTENT_TEMPERATURE,
                     format="json",
                 )
                 last_output = content
                 intent = _parse_intent(content)
+                self._store_intent(cache_key, content, intent)
                 return (
                     intent,
                     {
@@ -147,6 +181,31 @@ class OllamaClient:
                 last_error = str(exc)
         raise LLMClientError("Failed to build SessionSetup JSON.")
 
+    def _intent_cache_key(self, player_text: str, context: dict) -> tuple[str, str, str]:
+        return (
+            self.model,
+            " ".join(player_text.split()),
+            json.dumps(_intent_context_payload(context), sort_keys=True, default=str),
+        )
+
+    def _cached_intent(self, key: tuple[str, str, str]) -> tuple[str, Intent] | None:
+        with self._intent_cache_lock:
+            cached = self._intent_cache.get(key)
+            if cached is None:
+                return None
+            self._intent_cache.move_to_end(key)
+        content, intent = cached
+        return content, intent.model_copy(deep=True)
+
+    def _store_intent(self, key: tuple[str, str, str], content: str, intent: Intent) -> None:
+        if intent.action_type in _UNCACHED_INTENTS:
+            return
+        with self._intent_cache_lock:
+            self._intent_cache[key] = (content, intent.model_copy(deep=True))
+            self._intent_cache.move_to_end(key)
+            while len(self._intent_cache) > _INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+
     def _chat(
         self,
         *,
@@ -163,7 +222,7 @@ class OllamaClient:
         }
         if format:
             payload["format"] = format
-        response = requests.post(url, json=payload, timeout=self.timeout)
+        response = self._http.post(url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         data = response.json()
         message = data.get("message", {})
@@ -205,12 +264,7 @@ def _intent_messages(
 
     user = {
         "player_text": player_text,
-        "context": {
-            "era": context.get("era"),
-            "available_actions": context.get("available_actions", []),
-            "available_powers": context.get("available_powers", []),
-            "notes": context.get("notes"),
-        },
+        "context": _intent_context_payload(context),
     }
     return [
         {"role": "system", "content": system},
@@ -218,18 +272,44 @@ def _intent_messages(
     ]
 
 
+def _intent_context_payload(context: dict) -> dict[str, Any]:
+    return {
+        "era": context.get("era"),
+        "available_actions": context.get("available_actions", []),
+        "available_powers": context.get("available_powers", []),
+        "notes": context.get("notes"),
+    }
+
+
+_NARRATION_SYSTEM = (
+    "You narrate outcomes. Use the provided state summary and outcome only. "
+    "Keep it concise and grounded. Do not alter mechanics. "
+    "If current_scene.established is true, do not re-describe the scene. "
+    "Describe only changes, new details, or newly relevant information. "
+    "Never repeat the full scene summary and avoid the phrase 'What do you do next?'. "
+    "If nothing changed, say so briefly."
+)
+
+_SCENE_CONTEXT_KEYS = ("era", "location", "current_scene")
+
+
 def _narration_messages(narration_request: NarrationRequest) -> list[dict[str, str]]:
-    system = (
-        "You narrate outcomes. Use the provided state summary and outcome only. "
-        "Keep it concise and grounded. Do not alter mechanics. "
-        "If current_scene.established is true, do not re-describe the scene. "
-        "Describe only changes, new details, or newly relevant information. "
-        "Never repeat the full scene summary and avoid the phrase 'What do you do next?'. "
-        "If nothing changed, say so briefly."
-    )
+    # Scene-level context rarely changes between turns, so it rides in the
+    # system message with sorted keys; Ollama then reuses the cached prefix and
+    # only the per-turn state and outcome in the user message are re-read.
+    payload = narration_request.model_dump(mode="json")
+    state_summary = payload["state_summary"]
+    scene_context = {
+        key: state_summary.pop(key) for key in _SCENE_CONTEXT_KEYS if key in state_summary
+    }
+    system = _NARRATION_SYSTEM
+    if scene_context:
+        system += " Scene context: " + json.dumps(
+            scene_context, sort_keys=True, ensure_ascii=False
+        )
     return [
         {"role": "system", "content": system},
-        {"role": "user", "content": narration_request.model_dump_json()},
+        {"role": "user", "content": json.dumps(payload, sort_keys=True, ensure_ascii=False)},
     ]
 
 
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -149,11 +150,12 @@ class Session(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     rng_seed: Mapped[int | None] = mapped_column(Integer)
-    metadata_json: Mapped[dict | None] = mapped_column(JSONB)
+    metadata_json: Mapped[dict | None] = mapped_column(MutableDict.as_mutable(JSONB))
 
 
 class Character(Base):
     __tablename__ = "characters"
+    __table_args__ = (Index("ix_characters_session_id", "session_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -162,7 +164,7 @@ class Character(Base):
     profession_id: Mapped[int | None] = mapped_column(ForeignKey("professions.id"))
     training_id: Mapped[int | None] = mapped_column(ForeignKey("trainings.id"))
     level: Mapped[int | None] = mapped_column(Integer)
-    attributes_json: Mapped[dict | None] = mapped_column(JSONB)
+    attributes_json: Mapped[dict | None] = mapped_column(MutableDict.as_mutable(JSONB))
     skill_levels_json: Mapped[dict | None] = mapped_column(JSONB)
     gear_pack_json: Mapped[dict | None] = mapped_column(JSONB)
     statuses_json: Mapped[dict | None] = mapped_column(JSONB)
@@ -170,6 +172,7 @@ class Character(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_session_id_id", "session_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -198,6 +201,7 @@ class Monster(Base):
 
 class NPC(Base):
     __tablename__ = "npcs"
+    __table_args__ = (Index("ix_npcs_session_id_id", "session_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -215,6 +219,10 @@ class NPC(Base):
 
 class EntityLink(Base):
     __tablename__ = "entity_links"
+    __table_args__ = (
+        Index("ix_entity_links_from", "from_type", "from_id", "id"),
+        Index("ix_entity_links_to", "to_type", "to_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     from_type: Mapped[str] = mapped_column(String(80), nullable=False)
@@ -227,6 +235,7 @@ class EntityLink(Base):
 
 class Secret(Base):
     __tablename__ = "secrets"
+    __table_args__ = (Index("ix_secrets_owner", "owner_type", "owner_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     owner_type: Mapped[str] = mapped_column(String(80), nullable=False)
@@ -259,6 +268,7 @@ class Scene(Base):
 
 class Clock(Base):
     __tablename__ = "clocks"
+    __table_args__ = (Index("ix_clocks_session_id_id", "session_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -272,6 +282,7 @@ class Clock(Base):
 
 class Thread(Base):
     __tablename__ = "threads"
+    __table_args__ = (Index("ix_threads_session_id_id", "session_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -288,6 +299,9 @@ class Thread(Base):
 
 class MemoryCard(Base):
     __tablename__ = "memory_cards"
+    __table_args__ = (
+        Index("ix_memory_cards_session_entity", "session_id", "entity_type", "entity_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -346,6 +360,7 @@ class Discovery(Base):
 
 class PlayerProfile(Base):
     __tablename__ = "player_profile"
+    __table_args__ = (Index("ix_player_profile_session_id", "session_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     session_id: Mapped[int | None] = mapped_column(ForeignKey("sessions.id"))
@@ -17,6 +17,7 @@ from models import (
     Training,
 )
 from rules.combat import base_actions
+from rules.core import SLUG_SEPARATOR_PATTERN
 from rules.settings import generate_location_name, normalize_setting_type
 
 ATTRIBUTE_KEYS = ("CON", "DEX", "CHA", "WIS", "INT")
@@ -385,9 +386,7 @@ def _build_default_scene(*, era_name: str, location_name: str | None) -> dict:
 
 
 def _slugify(value: str) -> str:
-    cleaned = "".join(ch.lower() if ch.isalnum() else "_" for ch in value)
-    while "__" in cleaned:
-        cleaned = cleaned.replace("__", "_")
+    cleaned = SLUG_SEPARATOR_PATTERN.sub("_", value).lower()
     return cleaned.strip("_") or "scene"
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Iterable
 
 from rules.core import SessionState, roll, roll_d20
@@ -9,11 +10,13 @@ from rules.statuses import apply_status, tick_statuses, total_dex_penalty
 CALLED_SHOT_PENALTY = 5
 DODGE_BONUS_DEFAULT = 2
 
-CALLED_SHOT_EFFECTS = {
-    "disarm": "Target drops a held item on hit.",
-    "slow": "Target movement reduced until end of next turn.",
-    "stun_attempt": "Target must resist or be Stunned.",
-}
+CALLED_SHOT_EFFECTS = MappingProxyType(
+    {
+        "disarm": "Target drops a held item on hit.",
+        "slow": "Target movement reduced until end of next turn.",
+        "stun_attempt": "Target must resist or be Stunned.",
+    }
+)
 
 
 @dataclass
@@ -109,8 +112,9 @@ def resolve_attack(
     if called_shot and called_shot_effect not in CALLED_SHOT_EFFECTS:
         raise ValueError("Unknown called shot effect.")
 
-    dodge_bonus = _dodge_bonus(reaction, reaction_bonus)
-    target_ar = defender.armor_rating + dodge_bonus
+    target_ar = defender.armor_rating + (
+        (reaction_bonus or DODGE_BONUS_DEFAULT) if reaction == "dodge" else 0
+    )
 
     attack_roll = attack_roll_override or roll_d20(session)
     crit = attack_roll >= 19
@@ -187,14 +191,6 @@ def resolve_attack(
     return result, attacker, updated_defender
 
 
-def _dodge_bonus(reaction: str | None, reaction_bonus: int) -> int:
-    if reaction != "dodge":
-        return 0
-    if reaction_bonus:
-        return reaction_bonus
-    return DODGE_BONUS_DEFAULT
-
-
 def _roll_damage(
     session: SessionState,
     dice_str: str,
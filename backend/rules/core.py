@@ -2,20 +2,27 @@ from __future__ import annotations
 
 import random
 import re
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Iterable
 
 DICE_PATTERN = re.compile(r"^\s*(\d*)d(\d+)([+-]\d+)?\s*$", re.IGNORECASE)
 INTEGER_PATTERN = re.compile(r"^\s*\d+\s*$")
+SLUG_SEPARATOR_PATTERN = re.compile(r"[\W_]+")
+DEFAULT_LOG_LIMIT = 4096
 
 
 @dataclass
 class SessionState:
     seed: int
-    turn_log: list[dict] = field(default_factory=list)
+    log_limit: int | None = DEFAULT_LOG_LIMIT
+    turn_log: deque[dict] = field(init=False)
+    roll_count: int = field(default=0, init=False)
     rng: random.Random = field(init=False)
 
     def __post_init__(self) -> None:
+        self.turn_log = deque(maxlen=self.log_limit)
         self.rng = random.Random(self.seed)
 
 
@@ -28,11 +35,13 @@ def _log_roll(
     modifier: int,
     label: str | None,
 ) -> None:
+    rolls = list(rolls)
+    session.roll_count += len(rolls)
     session.turn_log.append(
         {
             "formula": formula,
             "result": result,
-            "rolls": list(rolls),
+            "rolls": rolls,
             "modifier": modifier,
             "label": label,
         }
@@ -41,29 +50,32 @@ def _log_roll(
 
 def roll_d20(session: SessionState, *, label: str | None = None) -> int:
     result = session.rng.randint(1, 20)
-    _log_roll(
-        session,
-        formula="1d20",
-        result=result,
-        rolls=[result],
-        modifier=0,
-        label=label,
+    session.roll_count += 1
+    session.turn_log.append(
+        {
+            "formula": "1d20",
+            "result": result,
+            "rolls": [result],
+            "modifier": 0,
+            "label": label,
+        }
     )
     return result
 
 
-def roll(session: SessionState, dice_str: str, *, label: str | None = None) -> int:
+@dataclass(frozen=True, slots=True)
+class DiceSpec:
+    formula: str
+    count: int
+    sides: int
+    modifier: int
+
+
+@lru_cache(maxsize=256)
+def parse_dice(dice_str: str) -> DiceSpec:
     if INTEGER_PATTERN.match(dice_str):
-        result = int(dice_str)
-        _log_roll(
-            session,
-            formula=str(result),
-            result=result,
-            rolls=[],
-            modifier=0,
-            label=label,
-        )
-        return result
+        value = int(dice_str)
+        return DiceSpec(formula=str(value), count=0, sides=0, modifier=value)
 
     match = DICE_PATTERN.match(dice_str)
     if not match:
@@ -76,15 +88,35 @@ def roll(session: SessionState, dice_str: str, *, label: str | None = None) -> i
 
     if count <= 0 or sides <= 0:
         raise ValueError(f"Invalid dice string: {dice_str}")
+    return DiceSpec(formula=dice_str.strip(), count=count, sides=sides, modifier=modifier)
+
+
+def roll(session: SessionState, dice_str: str, *, label: str | None = None) -> int:
+    return roll_spec(session, parse_dice(dice_str), label=label)
+
+
+def roll_spec(session: SessionState, spec: DiceSpec, *, label: str | None = None) -> int:
+    if not spec.count:
+        _log_roll(
+            session,
+            formula=spec.formula,
+            result=spec.modifier,
+            rolls=[],
+            modifier=0,
+            label=label,
+        )
+        return spec.modifier
 
-    rolls = [session.rng.randint(1, sides) for _ in range(count)]
-    total = sum(rolls) + modifier
+    randint = session.rng.randint
+    sides = spec.sides
+    rolls = [randint(1, sides) for _ in range(spec.count)]
+    total = sum(rolls) + spec.modifier
     _log_roll(
         session,
-        formula=dice_str.strip(),
+        formula=spec.formula,
         result=total,
         rolls=rolls,
-        modifier=modifier,
+        modifier=spec.modifier,
         label=label,
     )
     return total
@@ -5,6 +5,10 @@ from dataclasses import dataclass
 from typing import Any, Iterable
 
 
+_EMPTY_TAGS: frozenset[str] = frozenset()
+_ENERGY_TAGS = frozenset({"plasma", "energy", "laser"})
+
+
 class EconomyError(ValueError):
     pass
 
@@ -58,17 +62,17 @@ def is_item_legal_for_era(
     tag_set = {tag.strip().lower() for tag in (tags or []) if isinstance(tag, str)}
     name_lower = item_name.strip().lower()
 
-    illegal_tags = set()
-    illegal_tags.update(_extract_tag_list(era_profile, "illegal_tags", "restricted_tags"))
-    illegal_tags.update(_extract_tag_list(era_patch, "illegal_tags", "restricted_tags"))
-
-    illegal_items = set()
-    illegal_items.update(_extract_tag_list(era_profile, "illegal_items"))
-    illegal_items.update(_extract_tag_list(era_patch, "illegal_items"))
-
-    if name_lower in illegal_items:
+    if name_lower in _extract_tag_list(era_profile, "illegal_items"):
+        return False
+    if name_lower in _extract_tag_list(era_patch, "illegal_items"):
+        return False
+    if not tag_set.isdisjoint(
+        _extract_tag_list(era_profile, "illegal_tags", "restricted_tags")
+    ):
         return False
-    if illegal_tags.intersection(tag_set):
+    if not tag_set.isdisjoint(
+        _extract_tag_list(era_patch, "illegal_tags", "restricted_tags")
+    ):
         return False
 
     allow_plasma = _extract_bool(
@@ -78,7 +82,7 @@ def is_item_legal_for_era(
     )
 
     if era != "space" and not allow_plasma:
-        if "plasma" in tag_set or "energy" in tag_set or "laser" in tag_set:
+        if not tag_set.isdisjoint(_ENERGY_TAGS):
             return False
         if "plasma" in name_lower or "laser" in name_lower:
             return False
@@ -116,16 +120,16 @@ def _extract_price_multiplier(stats: Any) -> float | None:
     return None
 
 
-def _extract_tag_list(data: dict | None, *keys: str) -> set[str]:
+def _extract_tag_list(data: dict | None, *keys: str) -> frozenset[str]:
     if not isinstance(data, dict):
-        return set()
+        return _EMPTY_TAGS
     for key in keys:
         value = data.get(key)
         if isinstance(value, list):
-            return {str(item).strip().lower() for item in value}
+            return frozenset(str(item).strip().lower() for item in value)
         if isinstance(value, str):
-            return {value.strip().lower()}
-    return set()
+            return frozenset((value.strip().lower(),))
+    return _EMPTY_TAGS
 
 
 def _extract_bool(data: dict | None, *keys: str) -> bool:
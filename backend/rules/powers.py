@@ -3,39 +3,39 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from rules.statuses import apply_status
 
-POWER_FILES = {
-    "Sherlock": "sherlock.json",
-    "Teleportation": "teleportation.json",
-    "Power Drain": "power_drain.json",
-    "Superspeed": "superspeed.json",
-}
-
-POWER_EFFECTS = {
-    "sherlock.scanning_gaze": {
-        "type": "status",
-        "status": "Concentration",
-        "duration": 1,
-    },
-    "teleportation.vanish": {
-        "type": "status",
-        "status": "Hidden",
-        "duration": 1,
-    },
-    "power_drain.reserve": {
-        "type": "resource",
-        "resource": "reserve_charges",
-        "delta": 1,
-    },
-    "superspeed.time_dilation": {
-        "type": "resource",
-        "resource": "extra_actions",
-        "delta": 2,
-    },
-}
+_POWER_ERAS = frozenset({"space"})
+
+POWER_FILES = MappingProxyType(
+    {
+        "Sherlock": "sherlock.json",
+        "Teleportation": "teleportation.json",
+        "Power Drain": "power_drain.json",
+        "Superspeed": "superspeed.json",
+    }
+)
+
+POWER_EFFECTS = MappingProxyType(
+    {
+        "sherlock.scanning_gaze": MappingProxyType(
+            {"type": "status", "status": "Concentration", "duration": 1}
+        ),
+        "teleportation.vanish": MappingProxyType(
+            {"type": "status", "status": "Hidden", "duration": 1}
+        ),
+        "power_drain.reserve": MappingProxyType(
+            {"type": "resource", "resource": "reserve_charges", "delta": 1}
+        ),
+        "superspeed.time_dilation": MappingProxyType(
+            {"type": "resource", "resource": "extra_actions", "delta": 2}
+        ),
+    }
+)
+NO_EFFECT = MappingProxyType({"type": "none"})
 
 
 class PowerError(ValueError):
@@ -88,7 +88,7 @@ def load_power_catalog() -> dict[str, PowerDefinition]:
         for power_id, data in powers.items():
             if not isinstance(data, dict):
                 continue
-            effect = POWER_EFFECTS.get(power_id, {"type": "none"})
+            effect = dict(POWER_EFFECTS.get(power_id, NO_EFFECT))
             catalog[power_id] = PowerDefinition(
                 power_id=power_id,
                 name=data.get("name") or power_id,
@@ -114,7 +114,7 @@ def get_power_definition(power_id: str) -> PowerDefinition:
 
 
 def use_power(era_name: str, character: Any, power_id: str) -> PowerUseResult:
-    if era_name.strip().lower() != "space":
+    if era_name.strip().lower() not in _POWER_ERAS:
         raise PowerError("Powers are locked outside the Space era.")
 
     power = get_power_definition(power_id)
@@ -152,26 +152,26 @@ def _has_power_unlocked(character: Any, power: PowerDefinition) -> bool:
     return power.school.lower() in unlocked_schools
 
 
-def _extract_power_list(data: dict) -> set[str]:
+def _extract_power_list(data: dict) -> frozenset[str]:
     for key in ("powers_unlocked", "powers", "unlocked_powers"):
         value = data.get(key)
         if isinstance(value, list):
-            return {str(item) for item in value}
+            return frozenset(str(item) for item in value)
         if isinstance(value, dict):
-            return {str(name) for name, enabled in value.items() if enabled}
+            return frozenset(str(name) for name, enabled in value.items() if enabled)
         if isinstance(value, str):
-            return {value}
-    return set()
+            return frozenset((value,))
+    return frozenset()
 
 
-def _extract_school_list(data: dict) -> set[str]:
+def _extract_school_list(data: dict) -> frozenset[str]:
     for key in ("power_schools", "schools"):
         value = data.get(key)
         if isinstance(value, list):
-            return {str(item).lower() for item in value}
+            return frozenset(str(item).lower() for item in value)
         if isinstance(value, str):
-            return {value.lower()}
-    return set()
+            return frozenset((value.lower(),))
+    return frozenset()
 
 
 def _apply_effect_to_statuses(statuses: dict, effect: dict[str, Any]) -> dict:
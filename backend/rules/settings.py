@@ -1,48 +1,59 @@
 from __future__ import annotations
 
 import random
+from types import MappingProxyType
 
-CANONICAL_TYPES: dict[str, set[str]] = {
-    "frontier town": {"frontier town", "frontier", "town", "frontier-town"},
-    "megacity": {"megacity", "mega city", "mega-city", "metro", "city"},
-    "mining outpost": {"mining outpost", "mining", "outpost", "mining-outpost"},
-    "moonbase": {"moonbase", "moon base", "lunar base"},
-    "jungle ruin": {"jungle ruin", "jungle", "ruin", "jungle-ruin"},
-    "desert highway": {"desert highway", "desert", "highway"},
-    "floating arcology": {"floating arcology", "arcology", "floating"},
-    "undersea habitat": {"undersea habitat", "undersea", "sea base", "aquatic"},
-    "space station": {"space station", "station", "orbital"},
-    "other": {"other", "custom"},
-}
+CANONICAL_TYPES = MappingProxyType(
+    {
+        "frontier town": frozenset({"frontier town", "frontier", "town", "frontier-town"}),
+        "megacity": frozenset({"megacity", "mega city", "mega-city", "metro", "city"}),
+        "mining outpost": frozenset({"mining outpost", "mining", "outpost", "mining-outpost"}),
+        "moonbase": frozenset({"moonbase", "moon base", "lunar base"}),
+        "jungle ruin": frozenset({"jungle ruin", "jungle", "ruin", "jungle-ruin"}),
+        "desert highway": frozenset({"desert highway", "desert", "highway"}),
+        "floating arcology": frozenset({"floating arcology", "arcology", "floating"}),
+        "undersea habitat": frozenset({"undersea habitat", "undersea", "sea base", "aquatic"}),
+        "space station": frozenset({"space station", "station", "orbital"}),
+        "other": frozenset({"other", "custom"}),
+    }
+)
 
-DEFAULT_TYPE_BY_ERA = {
-    "prehistoric": "jungle ruin",
-    "medieval": "frontier town",
-    "colonial": "frontier town",
-    "modern": "megacity",
-    "space": "space station",
-}
+DEFAULT_TYPE_BY_ERA = MappingProxyType(
+    {
+        "prehistoric": "jungle ruin",
+        "medieval": "frontier town",
+        "colonial": "frontier town",
+        "modern": "megacity",
+        "space": "space station",
+    }
+)
 
-ERA_PREFIXES = {
-    "prehistoric": ["Stone", "Amber", "Wild", "Sun", "Echo"],
-    "medieval": ["Iron", "Crown", "Mist", "Ebon", "Silver"],
-    "colonial": ["Frontier", "Harbor", "Union", "Liberty", "Foundry"],
-    "modern": ["Metro", "Central", "Bright", "Neon", "Axis"],
-    "space": ["Nova", "Vega", "Aurora", "Helix", "Orion"],
-}
+ERA_PREFIXES = MappingProxyType(
+    {
+        "prehistoric": ("Stone", "Amber", "Wild", "Sun", "Echo"),
+        "medieval": ("Iron", "Crown", "Mist", "Ebon", "Silver"),
+        "colonial": ("Frontier", "Harbor", "Union", "Liberty", "Foundry"),
+        "modern": ("Metro", "Central", "Bright", "Neon", "Axis"),
+        "space": ("Nova", "Vega", "Aurora", "Helix", "Orion"),
+    }
+)
 
-TYPE_SUFFIXES = {
-    "frontier town": ["Gulch", "Crossing", "Fork", "Hollow", "Ridge"],
-    "megacity": ["Sprawl", "Metroplex", "Sector", "Stack", "District"],
-    "mining outpost": ["Pit", "Claim", "Shaft", "Quarry", "Outpost"],
-    "moonbase": ["Crater", "Luna Base", "Moonpost", "Lunar Hold", "Dustworks"],
-    "jungle ruin": ["Ruin", "Temple", "Vault", "Sanctum", "Ziggurat"],
-    "desert highway": ["Trace", "Run", "Line", "Causeway", "Trail"],
-    "floating arcology": ["Arcology", "Skyhold", "Spire", "Aerie", "Drift"],
-    "undersea habitat": ["Habitat", "Trench", "Atoll", "Deep", "Nexus"],
-    "space station": ["Station", "Ring", "Spindle", "Dock", "Platform"],
-    "other": ["Outpost", "Haven", "Nexus", "Hold", "Site"],
-}
+TYPE_SUFFIXES = MappingProxyType(
+    {
+        "frontier town": ("Gulch", "Crossing", "Fork", "Hollow", "Ridge"),
+        "megacity": ("Sprawl", "Metroplex", "Sector", "Stack", "District"),
+        "mining outpost": ("Pit", "Claim", "Shaft", "Quarry", "Outpost"),
+        "moonbase": ("Crater", "Luna Base", "Moonpost", "Lunar Hold", "Dustworks"),
+        "jungle ruin": ("Ruin", "Temple", "Vault", "Sanctum", "Ziggurat"),
+        "desert highway": ("Trace", "Run", "Line", "Causeway", "Trail"),
+        "floating arcology": ("Arcology", "Skyhold", "Spire", "Aerie", "Drift"),
+        "undersea habitat": ("Habitat", "Trench", "Atoll", "Deep", "Nexus"),
+        "space station": ("Station", "Ring", "Spindle", "Dock", "Platform"),
+        "other": ("Outpost", "Haven", "Nexus", "Hold", "Site"),
+    }
+)
+
+FALLBACK_PREFIXES = ("Anchor", "Drift", "Cross", "Prime")
 
 
 def normalize_setting_type(value: str | None, *, era_name: str | None = None) -> str:
@@ -67,9 +78,10 @@ def generate_location_name(
 ) -> str:
     rng = random.Random(seed)
     era_key = (era_name or "").strip().lower()
-    prefix_pool = ERA_PREFIXES.get(era_key, ["Anchor", "Drift", "Cross", "Prime"])
+    prefix_pool = ERA_PREFIXES.get(era_key, FALLBACK_PREFIXES)
     normalized_type = normalize_setting_type(setting_type, era_name=era_name)
     suffix_pool = TYPE_SUFFIXES.get(normalized_type, TYPE_SUFFIXES["other"])
-    prefix = rng.choice(prefix_pool)
-    suffix = rng.choice(suffix_pool)
+    draw = rng.getrandbits(32)
+    prefix = prefix_pool[(draw & 0xFFFF) % len(prefix_pool)]
+    suffix = suffix_pool[(draw >> 16) % len(suffix_pool)]
     return f"{prefix} {suffix}"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import copy
-from typing import Any
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 STATUS_CANONICAL = {
     "bleeding": "Bleeding",
@@ -30,7 +31,17 @@ DEFAULT_DURATIONS = {
 }
 
 
+_NO_EXPIRED: tuple[str, ...] = ()
+
+
 def normalize_status(name: str) -> str:
+    if name in DEFAULT_DURATIONS:
+        return name
+    return _normalize_cached(name)
+
+
+@lru_cache(maxsize=64)
+def _normalize_cached(name: str) -> str:
     key = name.strip().lower()
     if key in STATUS_CANONICAL:
         return STATUS_CANONICAL[key]
@@ -45,122 +56,250 @@ def apply_status(
     level: int = 1,
     duration: int | None = None,
 ) -> dict:
+    updated = dict(statuses or {})
+    _apply_status_inplace(updated, name, stacks=stacks, level=level, duration=duration)
+    return updated
+
+
+def ramp_status(
+    statuses: dict | None,
+    name: str,
+    *,
+    trigger: str,
+    amount: int = 1,
+) -> dict:
+    updated = dict(statuses or {})
+    _ramp_status_inplace(updated, name, trigger=trigger, amount=amount)
+    return updated
+
+
+# The *_inplace variants mutate the given map for callers that own it. Entries
+# are still replaced rather than edited, so maps sharing entries stay intact.
+def _apply_status_inplace(
+    statuses: dict,
+    name: str,
+    *,
+    stacks: int = 1,
+    level: int = 1,
+    duration: int | None = None,
+) -> None:
     canonical = normalize_status(name)
-    updated = copy.deepcopy(statuses or {})
-    entry = updated.get(canonical, {"stacks": 0, "level": 0, "duration": None})
+    entry = dict(statuses[canonical]) if canonical in statuses else _new_entry()
 
     entry["stacks"] = max(1, int(entry.get("stacks", 0)) + int(stacks))
-    entry["level"] = max(int(entry.get("level", 0)), int(level))
+    level = int(level)
+    current = int(entry.get("level", 0))
+    entry["level"] = level if current < level else current
 
     if duration is None:
         duration = DEFAULT_DURATIONS.get(canonical)
     if duration is not None:
-        existing = entry.get("duration")
-        if existing is None:
-            entry["duration"] = int(duration)
-        else:
-            entry["duration"] = max(int(existing), int(duration))
+        _bump_duration(entry, int(duration))
 
-    updated[canonical] = entry
-    return updated
+    statuses[canonical] = entry
 
 
-def ramp_status(
-    statuses: dict | None,
+def _ramp_status_inplace(
+    statuses: dict,
     name: str,
     *,
     trigger: str,
     amount: int = 1,
-) -> dict:
+) -> None:
     canonical = normalize_status(name)
-    updated = copy.deepcopy(statuses or {})
-    entry = updated.get(canonical, {"stacks": 1, "level": 1, "duration": None})
-
-    trigger_key = trigger.strip().lower()
-    if canonical == "Bleeding" and trigger_key == "move":
-        entry["stacks"] = int(entry.get("stacks", 1)) + amount
-        entry["level"] = max(int(entry.get("level", 1)), entry["stacks"])
-        entry["duration"] = max(int(entry.get("duration") or 0), 3)
-    elif canonical == "Ignited" and trigger_key in {"ignite", "fuel"}:
-        entry["level"] = int(entry.get("level", 1)) + amount
-        entry["duration"] = max(int(entry.get("duration") or 0), 3)
-    elif canonical == "Cold" and trigger_key in {"cold", "exposure"}:
-        entry["level"] = int(entry.get("level", 1)) + amount
-        entry["duration"] = max(int(entry.get("duration") or 0), 3)
-    elif canonical == "Disease" and trigger_key == "day":
-        entry["level"] = int(entry.get("level", 1)) + amount
-    elif canonical == "Asphyxiation" and trigger_key == "no_air":
-        entry["level"] = int(entry.get("level", 1)) + amount
-        entry["duration"] = max(int(entry.get("duration") or 0), 2)
-    elif canonical == "Toxin" and trigger_key in {"exposed", "dose"}:
-        entry["level"] = int(entry.get("level", 1)) + amount
-        entry["duration"] = max(int(entry.get("duration") or 0), 3)
-    elif canonical == "Injured" and trigger_key in {"worsen", "hit"}:
-        entry["level"] = int(entry.get("level", 1)) + amount
-        entry["duration"] = max(int(entry.get("duration") or 0), 3)
-    elif canonical in {"Hidden", "Concentration", "Stun"} and trigger_key == "refresh":
-        duration = DEFAULT_DURATIONS.get(canonical)
-        if duration is not None:
-            entry["duration"] = max(int(entry.get("duration") or 0), duration)
+    handler = RAMP_RULES.get((canonical, trigger.strip().lower()))
+    if handler is None:
+        if canonical not in statuses:
+            statuses[canonical] = _new_entry(stacks=1, level=1)
+        return
 
-    updated[canonical] = entry
-    return updated
+    if canonical in statuses:
+        entry = dict(statuses[canonical])
+    else:
+        entry = _new_entry(stacks=1, level=1)
+    handler(entry, amount)
+    statuses[canonical] = entry
+
+
+RampHandler = Callable[[dict, int], None]
+
+
+def _new_entry(*, stacks: int = 0, level: int = 0, duration: int | None = None) -> dict:
+    return {"stacks": stacks, "level": level, "duration": duration}
+
+
+def _bump_duration(entry: dict, floor: int) -> None:
+    current = entry.get("duration")
+    if current is not None:
+        current = int(current or 0)
+    entry["duration"] = floor if current is None or current < floor else current
+
+
+def _ramp_bleeding(entry: dict, amount: int) -> None:
+    stacks = int(entry.get("stacks", 1)) + amount
+    entry["stacks"] = stacks
+    current = int(entry.get("level", 1))
+    entry["level"] = stacks if current < stacks else current
+    _bump_duration(entry, 3)
+
+
+def _ramp_level(entry: dict, amount: int, *, duration: int | None) -> None:
+    entry["level"] = int(entry.get("level", 1)) + amount
+    if duration is not None:
+        _bump_duration(entry, duration)
+
+
+def _refresh_duration(entry: dict, amount: int, *, duration: int | None) -> None:
+    if duration is not None:
+        _bump_duration(entry, duration)
+
+
+RAMP_RULES: Mapping[tuple[str, str], RampHandler] = MappingProxyType(
+    {
+        ("Bleeding", "move"): _ramp_bleeding,
+        ("Ignited", "ignite"): partial(_ramp_level, duration=3),
+        ("Ignited", "fuel"): partial(_ramp_level, duration=3),
+        ("Cold", "cold"): partial(_ramp_level, duration=3),
+        ("Cold", "exposure"): partial(_ramp_level, duration=3),
+        ("Disease", "day"): partial(_ramp_level, duration=None),
+        ("Asphyxiation", "no_air"): partial(_ramp_level, duration=2),
+        ("Toxin", "exposed"): partial(_ramp_level, duration=3),
+        ("Toxin", "dose"): partial(_ramp_level, duration=3),
+        ("Injured", "worsen"): partial(_ramp_level, duration=3),
+        ("Injured", "hit"): partial(_ramp_level, duration=3),
+        **{
+            (name, "refresh"): partial(
+                _refresh_duration, duration=DEFAULT_DURATIONS[name]
+            )
+            for name in ("Hidden", "Concentration", "Stun")
+        },
+    }
+)
 
 
 def tick_statuses(
     statuses: dict | None,
     *,
     tick_type: str = "turn",
-) -> tuple[dict, int, list[str]]:
-    updated = copy.deepcopy(statuses or {})
-    hp_delta = 0
-    expired: list[str] = []
+) -> tuple[dict, int, Sequence[str]]:
+    updated = dict(statuses or {})
+    hp_delta, expired = _tick_statuses_inplace(updated, tick_type=tick_type)
+    return updated, hp_delta, expired
+
+
+def apply_many_then_tick(
+    statuses: dict | None,
+    applications: Iterable[tuple[str, dict]],
+    *,
+    tick_type: str = "turn",
+) -> tuple[dict, int, Sequence[str]]:
+    updated = dict(statuses or {})
+    for name, options in applications:
+        _apply_status_inplace(updated, name, **options)
+    hp_delta, expired = _tick_statuses_inplace(updated, tick_type=tick_type)
+    return updated, hp_delta, expired
+
+
+def _tick_statuses_inplace(
+    statuses: dict,
+    *,
+    tick_type: str = "turn",
+) -> tuple[int, Sequence[str]]:
+    if not statuses.keys() <= DEFAULT_DURATIONS.keys():
+        canonical = _canonicalize_keys(statuses)
+        statuses.clear()
+        statuses.update(canonical)
     tick_key = tick_type.strip().lower()
+    if tick_key == "turn":
+        return _tick_turn(statuses)
+    if tick_key == "day":
+        return _tick_day(statuses)
+    return 0, _NO_EXPIRED
 
-    for name, entry in list(updated.items()):
-        canonical = normalize_status(name)
-        entry = dict(entry)
-        stacks = int(entry.get("stacks", 1))
-        level = int(entry.get("level", 1))
-
-        if canonical == "Bleeding" and tick_key == "turn":
-            hp_delta -= max(1, stacks) * max(1, level)
-        elif canonical == "Ignited" and tick_key == "turn":
-            hp_delta -= 2 * max(1, level)
-        elif canonical == "Asphyxiation" and tick_key == "turn":
-            hp_delta -= 2 * max(1, level)
-        elif canonical == "Toxin" and tick_key == "turn":
-            hp_delta -= max(1, level)
-        elif canonical == "Disease" and tick_key == "day":
-            level = max(1, level) + 1
-            entry["level"] = level
-            hp_delta -= level
+
+def _bleeding_damage(entry: dict) -> int:
+    return max(1, int(entry.get("stacks", 1))) * max(1, int(entry.get("level", 1)))
+
+
+def _burn_damage(entry: dict) -> int:
+    return 2 * max(1, int(entry.get("level", 1)))
+
+
+def _toxin_damage(entry: dict) -> int:
+    return max(1, int(entry.get("level", 1)))
+
+
+_TURN_DAMAGE: Mapping[str, Callable[[dict], int]] = MappingProxyType(
+    {
+        "Bleeding": _bleeding_damage,
+        "Ignited": _burn_damage,
+        "Asphyxiation": _burn_damage,
+        "Toxin": _toxin_damage,
+    }
+)
+
+
+def _tick_turn(statuses: dict[str, dict]) -> tuple[int, Sequence[str]]:
+    hp_delta: int = 0
+    expired: list[str] | None = None
+
+    for name, entry in statuses.items():
+        damage = _TURN_DAMAGE.get(name)
+        if damage is not None:
+            hp_delta -= damage(entry)
 
         duration = entry.get("duration")
-        if duration is not None and tick_key == "turn":
-            duration = int(duration) - 1
-            if duration <= 0:
-                expired.append(canonical)
-                updated.pop(canonical, None)
+        if duration is not None:
+            remaining: int = int(duration) - 1
+            if remaining <= 0:
+                if expired is None:
+                    expired = []
+                expired.append(name)
                 continue
-            entry["duration"] = duration
+            statuses[name] = {**entry, "duration": remaining}
 
-        updated[canonical] = entry
+    if expired is None:
+        return hp_delta, _NO_EXPIRED
+    for name in expired:
+        del statuses[name]
+    return hp_delta, expired
 
-    return updated, hp_delta, expired
+
+def _tick_day(statuses: dict[str, dict]) -> tuple[int, Sequence[str]]:
+    hp_delta: int = 0
+    entry = statuses.get("Disease")
+    if entry is not None:
+        level: int = max(1, int(entry.get("level", 1))) + 1
+        statuses["Disease"] = {**entry, "level": level}
+        hp_delta -= level
+    return hp_delta, _NO_EXPIRED
+
+
+def _canonicalize_keys(statuses: dict) -> dict:
+    return {normalize_status(name): entry for name, entry in statuses.items()}
 
 
 def total_dex_penalty(statuses: dict | None) -> int:
     if not isinstance(statuses, dict):
         return 0
+    if statuses.keys() <= DEFAULT_DURATIONS.keys():
+        entry = statuses.get("Cold")
+        if entry is None:
+            return 0
+        return max(1, int(entry.get("level", 1)))
     penalty = 0
     for name, entry in statuses.items():
-        canonical = normalize_status(name)
-        level = int(entry.get("level", 1))
-        if canonical == "Cold":
-            penalty += max(1, level)
+        if normalize_status(name) == "Cold":
+            penalty += max(1, int(entry.get("level", 1)))
     return penalty
 
 
 def status_snapshot(statuses: dict | None) -> dict[str, Any]:
-    return copy.deepcopy(statuses or {})
+    return _copy_statuses(statuses)
+
+
+def _copy_statuses(statuses: dict | None) -> dict:
+    # Entries only ever hold scalars, so a per-entry copy matches deepcopy.
+    if not statuses:
+        return {}
+    return {name: dict(entry) for name, entry in statuses.items()}
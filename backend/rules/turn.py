@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import hashlib
 import json
-import random
+import re
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from types import MappingProxyType
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping
 
 from db import SessionLocal
 from models import (
@@ -27,8 +30,28 @@ from gm_os.schemas import SystemDraft as SystemDraftSchema
 from llm.client import OllamaClient
 from llm.schemas import Intent, NarrationRequest
 from rules.combat import base_actions
-from rules.core import SessionState, roll, roll_d20
+from rules.core import SLUG_SEPARATOR_PATTERN, SessionState, roll, roll_d20
+
+
+_SPACESHIP_KEYWORDS = re.compile(r"s(?:pace|tar) ?ship", re.IGNORECASE)
+_MEMORY_RECALL_TRIGGERS = re.compile(
+    "|".join(
+        re.escape(trigger)
+        for trigger in (
+            "what do i know",
+            "what do we know",
+            "what do i remember",
+            "why am i here",
+            "didn't you say",
+            "did you say",
+            "what did you say",
+            "what do you remember",
+        )
+    ),
+    re.IGNORECASE,
+)
 
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
 
 class TurnError(ValueError):
     pass
@@ -207,8 +230,6 @@ def execute_turn(
         _update_player_profile(db, session, result.intent)
         promote_memories_for_session(db, session, turn_count_threshold=100)
         db.commit()
-        db.refresh(session)
-        db.refresh(character)
         return result
 
 
@@ -290,61 +311,23 @@ def execute_turn_for_state(
         )
 
     decision = route_envelope(envelope, _build_session_state(session))
-    if decision.protocol_id == ProtocolId.PROTO_RETCON_DISPUTE:
-        return _retcon_dispute_result(session, character, intent_context, debug_info)
-    if decision.protocol_id == ProtocolId.PROTO_RULE_EDGE_CASE:
-        return _rule_edge_case_result(
-            session,
-            character,
-            intent_context,
-            debug_info,
-            player_text,
-            envelope,
-        )
-    if decision.protocol_id == ProtocolId.PROTO_CONTENT_GAP:
-        return _content_gap_result(
-            session,
-            character,
-            intent_context,
-            debug_info,
-            player_text,
-            envelope,
-            system_draft_creator,
-        )
-    if decision.protocol_id == ProtocolId.PROTO_EXPLORATION:
-        return _exploration_result(
-            session,
-            character,
-            llm_client,
-            intent_context,
-            debug_info,
-            player_text,
-            envelope,
-            discovery_creator,
-            thread_creator,
-        )
-    if decision.protocol_id == ProtocolId.PROTO_MEMORY_RECALL:
-        return _memory_recall_result(
-            session,
-            character,
-            player_text,
-            llm_client,
-            intent_context,
-            debug_info,
-            threads or [],
-        )
-    if decision.protocol_id == ProtocolId.PROTO_STAGNATION:
-        return _stagnation_result(
-            session,
-            character,
-            llm_client,
-            intent_context,
-            debug_info,
-            player_text,
-            envelope,
-            threads or [],
-            clocks or [],
-            thread_creator,
+    protocol_handler = _PROTOCOL_HANDLERS.get(decision.protocol_id)
+    if protocol_handler is not None:
+        return protocol_handler(
+            _ProtocolContext(
+                session=session,
+                character=character,
+                player_text=player_text,
+                envelope=envelope,
+                llm_client=llm_client,
+                intent_context=intent_context,
+                debug_info=debug_info,
+                system_draft_creator=system_draft_creator,
+                discovery_creator=discovery_creator,
+                thread_creator=thread_creator,
+                threads=threads or [],
+                clocks=clocks or [],
+            )
         )
     if decision.freeze_time or not decision.execute:
         questions = decision.ooc_questions or [
@@ -394,6 +377,106 @@ def execute_turn_for_state(
     )
 
 
+@dataclass(frozen=True)
+class _ProtocolContext:
+    session: Any
+    character: Any
+    player_text: str
+    envelope: Any
+    llm_client: OllamaClient
+    intent_context: dict
+    debug_info: dict
+    system_draft_creator: Callable[[dict], dict] | None
+    discovery_creator: Callable[[dict], dict] | None
+    thread_creator: Callable[[dict], dict] | None
+    threads: list[Any]
+    clocks: list[Any]
+
+
+def _protocol_retcon_dispute(ctx: _ProtocolContext) -> TurnResult:
+    return _retcon_dispute_result(
+        ctx.session, ctx.character, ctx.intent_context, ctx.debug_info
+    )
+
+
+def _protocol_rule_edge_case(ctx: _ProtocolContext) -> TurnResult:
+    return _rule_edge_case_result(
+        ctx.session,
+        ctx.character,
+        ctx.intent_context,
+        ctx.debug_info,
+        ctx.player_text,
+        ctx.envelope,
+    )
+
+
+def _protocol_content_gap(ctx: _ProtocolContext) -> TurnResult:
+    return _content_gap_result(
+        ctx.session,
+        ctx.character,
+        ctx.intent_context,
+        ctx.debug_info,
+        ctx.player_text,
+        ctx.envelope,
+        ctx.system_draft_creator,
+    )
+
+
+def _protocol_exploration(ctx: _ProtocolContext) -> TurnResult:
+    return _exploration_result(
+        ctx.session,
+        ctx.character,
+        ctx.llm_client,
+        ctx.intent_context,
+        ctx.debug_info,
+        ctx.player_text,
+        ctx.envelope,
+        ctx.discovery_creator,
+        ctx.thread_creator,
+    )
+
+
+def _protocol_memory_recall(ctx: _ProtocolContext) -> TurnResult:
+    return _memory_recall_result(
+        ctx.session,
+        ctx.character,
+        ctx.player_text,
+        ctx.llm_client,
+        ctx.intent_context,
+        ctx.debug_info,
+        ctx.threads,
+    )
+
+
+def _protocol_stagnation(ctx: _ProtocolContext) -> TurnResult:
+    return _stagnation_result(
+        ctx.session,
+        ctx.character,
+        ctx.llm_client,
+        ctx.intent_context,
+        ctx.debug_info,
+        ctx.player_text,
+        ctx.envelope,
+        ctx.threads,
+        ctx.clocks,
+        ctx.thread_creator,
+    )
+
+
+_PROTOCOL_HANDLERS: Mapping[ProtocolId, Callable[[_ProtocolContext], TurnResult]] = (
+    MappingProxyType(
+        {
+            ProtocolId.PROTO_RETCON_DISPUTE: _protocol_retcon_dispute,
+            ProtocolId.PROTO_RULE_EDGE_CASE: _protocol_rule_edge_case,
+            ProtocolId.PROTO_CONTENT_GAP: _protocol_content_gap,
+            ProtocolId.PROTO_EXPLORATION: _protocol_exploration,
+            ProtocolId.PROTO_MEMORY_RECALL: _protocol_memory_recall,
+            ProtocolId.PROTO_STAGNATION: _protocol_stagnation,
+        }
+    )
+)
+
+
 def _extract_intent_or_fallback(
     llm_client: OllamaClient,
     player_text: str,
@@ -452,15 +535,10 @@ def _validate_impossible_action(
     player_text: str | None,
 ) -> str | None:
     era_label = era_name.strip() or "this era"
-    text_parts = [
-        player_text or "",
-        intent.dialogue or "",
-        intent.item_used or "",
-    ]
-    combined = " ".join(text_parts).lower()
-    spaceship_keywords = ("spaceship", "space ship", "starship", "star ship")
     if era_name.strip().lower() != "space" and any(
-        keyword in combined for keyword in spaceship_keywords
+        _SPACESHIP_KEYWORDS.search(text)
+        for text in (player_text, intent.dialogue, intent.item_used)
+        if text
     ):
         return (
             f"That action isn't possible. You are in a {era_label} setting. "
@@ -481,6 +559,7 @@ def _execute_intent_pipeline(
     if _should_log_retcon(intent, session):
         _log_retcon_event(session, intent)
     era_name = _extract_era_name(session)
+    location = _extract_location(session)
     impossible_reason = _validate_impossible_action(intent, era_name, player_text)
     if impossible_reason:
         debug_info["validation_errors"].append(impossible_reason)
@@ -543,11 +622,13 @@ def _execute_intent_pipeline(
     outcome = _execute_mechanics(session_state, mechanics_intent)
 
     resources["actions"] -= mechanics_intent.actions_required
-    updated_attributes = dict(character.attributes_json or {})
-    updated_attributes["resources"] = resources
-    updated_attributes["last_roll"] = outcome.get("attack_roll")
-    updated_attributes["last_damage"] = outcome.get("damage")
-    character.attributes_json = updated_attributes
+    if character.attributes_json is None:
+        character.attributes_json = {}
+    # Mutated in place: the column is a MutableDict, which flags the change.
+    attributes = character.attributes_json
+    attributes["resources"] = resources
+    attributes["last_roll"] = outcome.get("attack_roll")
+    attributes["last_damage"] = outcome.get("damage")
 
     rolls = list(session_state.turn_log)
     roll_index += _count_rolls(session_state)
@@ -556,6 +637,7 @@ def _execute_intent_pipeline(
     state_diff = {
         "character": _build_character_state_diff(
             character,
+            attributes,
             resources,
             outcome,
         ),
@@ -563,21 +645,32 @@ def _execute_intent_pipeline(
     }
 
     narration = llm_client.generate_narration(
-        _build_narration_request(session, character, intent, outcome)
+        _build_narration_request(
+            session,
+            character,
+            intent,
+            outcome,
+            era_name=era_name,
+            location=location,
+            resources=resources,
+        )
     )
     outcome["narration"] = narration
 
     if _is_dead(state_diff["character"]):
         outcome["death"] = True
         outcome["death_journal"] = llm_client.generate_narration(
-            _build_death_request(session, character, intent, outcome)
+            _build_death_request(
+                session, character, intent, outcome, era_name=era_name, location=location
+            )
         )
     else:
         outcome["death"] = False
+    intent_payload = intent.model_dump()
     narration_context = {
         "era": era_name,
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        "location": location,
+        "intent": intent_payload,
         "outcome": outcome,
     }
 
@@ -585,7 +678,7 @@ def _execute_intent_pipeline(
         intent_context.get("available_actions", [])
     )
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=rolls,
         outcome=outcome,
         state_diff=state_diff,
@@ -603,36 +696,72 @@ def _execute_intent_pipeline(
 
 
 def _execute_mechanics(session_state: SessionState, intent: TurnIntent) -> dict:
-    if intent.action == "attack":
-        attack_roll = roll_d20(session_state)
-        attack_total = attack_roll + intent.skill_bonus + intent.attr_bonus
-        hit = attack_total >= intent.target_ar
-        damage = roll(session_state, intent.weapon_damage) if hit else 0
-        return {
-            "hit": hit,
-            "attack_roll": attack_roll,
-            "attack_total": attack_total,
-            "target_ar": intent.target_ar,
-            "damage": damage,
-            "target": intent.target_label,
-        }
-    if intent.action == "explore":
-        return {"explore": True}
-    if intent.action == "scene_request":
-        return {"scene_request": True}
-    if intent.action == "interact":
-        return {"interact": True, "target": intent.target_label}
-    if intent.action == "use_power":
-        return {"used_power": intent.power_id}
-    if intent.action == "buy_item":
-        return {"buy_item": True, "item": intent.item_used}
-    if intent.action == "ask_gm":
-        return {"ask_gm": True}
-    if intent.action == "move":
-        return {"moved": True, "movement": intent.movement}
-    if intent.action == "pass":
-        return {"pass": True}
-    raise TurnError("Unsupported action.")
+    handler = _MECHANICS.get(intent.action)
+    if handler is None:
+        raise TurnError("Unsupported action.")
+    return handler(session_state, intent)
+
+
+def _mechanics_attack(session_state: SessionState, intent: TurnIntent) -> dict:
+    attack_roll = roll_d20(session_state)
+    attack_total = attack_roll + intent.skill_bonus + intent.attr_bonus
+    hit = attack_total >= intent.target_ar
+    damage = roll(session_state, intent.weapon_damage) if hit else 0
+    return {
+        "hit": hit,
+        "attack_roll": attack_roll,
+        "attack_total": attack_total,
+        "target_ar": intent.target_ar,
+        "damage": damage,
+        "target": intent.target_label,
+    }
+
+
+def _mechanics_explore(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"explore": True}
+
+
+def _mechanics_scene_request(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"scene_request": True}
+
+
+def _mechanics_interact(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"interact": True, "target": intent.target_label}
+
+
+def _mechanics_use_power(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"used_power": intent.power_id}
+
+
+def _mechanics_buy_item(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"buy_item": True, "item": intent.item_used}
+
+
+def _mechanics_ask_gm(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"ask_gm": True}
+
+
+def _mechanics_move(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"moved": True, "movement": intent.movement}
+
+
+def _mechanics_pass(session_state: SessionState, intent: TurnIntent) -> dict:
+    return {"pass": True}
+
+
+_MECHANICS: Mapping[str, Callable[[SessionState, TurnIntent], dict]] = MappingProxyType(
+    {
+        "attack": _mechanics_attack,
+        "explore": _mechanics_explore,
+        "scene_request": _mechanics_scene_request,
+        "interact": _mechanics_interact,
+        "use_power": _mechanics_use_power,
+        "buy_item": _mechanics_buy_item,
+        "ask_gm": _mechanics_ask_gm,
+        "move": _mechanics_move,
+        "pass": _mechanics_pass,
+    }
+)
 
 
 def _ensure_resources(attributes: dict | None) -> dict:
@@ -643,11 +772,20 @@ def _ensure_resources(attributes: dict | None) -> dict:
     return resources
 
 
-def _extract_roll_index(session: Any) -> int:
+def _session_metadata(session: Any) -> dict:
     metadata = session.metadata_json
-    if isinstance(metadata, dict):
-        return int(metadata.get("roll_index", 0))
-    return 0
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _ensure_session_metadata(session: Any) -> dict:
+    # Re-read after assigning: the mutable JSONB column stores its own copy.
+    if not isinstance(session.metadata_json, dict):
+        session.metadata_json = {}
+    return session.metadata_json
+
+
+def _extract_roll_index(session: Any) -> int:
+    return int(_session_metadata(session).get("roll_index", 0))
 
 
 def _append_turn_log(
@@ -657,7 +795,7 @@ def _append_turn_log(
     outcome: dict,
     roll_index: int,
 ) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     log = metadata.get("turn_log")
     if not isinstance(log, list):
         log = []
@@ -665,39 +803,37 @@ def _append_turn_log(
     metadata["turn_log"] = log
     metadata["roll_index"] = roll_index
     metadata["turn_index"] = len(log)
-    session.metadata_json = metadata
 
 
 def _consume_rolls(session_state: SessionState, roll_index: int) -> None:
-    for _ in range(roll_index):
-        session_state.rng.random()
+    # random() draws two 32-bit words per call, so one getrandbits call of
+    # 64 bits per roll leaves the generator in exactly the same state.
+    if roll_index > 0:
+        session_state.rng.getrandbits(64 * roll_index)
 
 
 def _count_rolls(session_state: SessionState) -> int:
-    draws = 0
-    for entry in session_state.turn_log:
-        rolls = entry.get("rolls", [])
-        if isinstance(rolls, list):
-            draws += len(rolls)
-    return draws
+    return session_state.roll_count
+
+
+def _session_context(session: Any) -> dict[str, str]:
+    metadata = _session_metadata(session)
+    return {
+        "era": str(metadata.get("era", "")),
+        "location": str(metadata.get("location", "")),
+    }
 
 
 def _extract_era_name(session: Any) -> str:
-    metadata = session.metadata_json
-    if isinstance(metadata, dict):
-        return str(metadata.get("era", ""))
-    return ""
+    return str(_session_metadata(session).get("era", ""))
 
 
 def _extract_location(session: Any) -> str:
-    metadata = session.metadata_json
-    if isinstance(metadata, dict):
-        return str(metadata.get("location", ""))
-    return ""
+    return str(_session_metadata(session).get("location", ""))
 
 
 def _ensure_scene_state(session: Any) -> dict:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     scene = metadata.get("current_scene")
     if isinstance(scene, dict):
         summary = scene.get("summary")
@@ -721,46 +857,44 @@ def _ensure_scene_state(session: Any) -> dict:
         "established": True,
     }
     metadata["current_scene"] = scene_state
-    session.metadata_json = metadata
     return scene_state
 
 
 def _extract_scene_text(session: Any) -> str:
-    metadata = session.metadata_json
-    if isinstance(metadata, dict):
-        for key in ("scene_text", "scene"):
-            value = metadata.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        scene = metadata.get("current_scene")
-        if isinstance(scene, dict):
-            summary = scene.get("summary")
-            if isinstance(summary, str) and summary.strip():
-                return summary.strip()
+    metadata = _session_metadata(session)
+    for key in ("scene_text", "scene"):
+        value = metadata.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    scene = metadata.get("current_scene")
+    if isinstance(scene, dict):
+        summary = scene.get("summary")
+        if isinstance(summary, str) and summary.strip():
+            return summary.strip()
     return ""
 
 
 def _has_scene_text(session: Any) -> bool:
-    metadata = session.metadata_json
-    if isinstance(metadata, dict):
-        return bool(metadata.get("scene_text") or metadata.get("scene"))
-    return False
+    metadata = _session_metadata(session)
+    return bool(metadata.get("scene_text") or metadata.get("scene"))
 
 
 def _store_scene_text(session: Any, text: str) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     metadata["scene_text"] = text
     scene = metadata.get("current_scene")
     if isinstance(scene, dict):
         scene.setdefault("summary", text)
         scene.setdefault("established", True)
         metadata["current_scene"] = scene
-    session.metadata_json = metadata
 
 
 def _shorten_text(text: str, limit: int = 220) -> str:
-    clean = " ".join(text.split())
-    if len(clean) <= limit:
+    # Every word is at least one character, so the first `limit` words always
+    # cover the cut; the rest of a long text is never split or joined.
+    words = text.split(maxsplit=limit)
+    clean = " ".join(words[:limit])
+    if len(words) <= limit and len(clean) <= limit:
         return clean
     return clean[:limit].rstrip() + "..."
 
@@ -775,7 +909,7 @@ def _fallback_scene_text(session: Any) -> str:
 
 
 def _extract_scene_lock(session: Any) -> dict:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     scene = metadata.get("current_scene")
     if isinstance(scene, dict):
         return {
@@ -787,19 +921,16 @@ def _extract_scene_lock(session: Any) -> dict:
 
 
 def _slugify(value: str) -> str:
-    cleaned = "".join(ch.lower() if ch.isalnum() else "_" for ch in value)
-    while "__" in cleaned:
-        cleaned = cleaned.replace("__", "_")
+    cleaned = SLUG_SEPARATOR_PATTERN.sub("_", value).lower()
     return cleaned.strip("_") or "scene"
 
 
 def _ensure_scene_text(session: Any, character: Any, llm_client: OllamaClient) -> str:
     existing = _extract_scene_text(session)
     if existing:
-        metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+        metadata = _ensure_session_metadata(session)
         if "scene_text" not in metadata:
             metadata["scene_text"] = existing
-            session.metadata_json = metadata
         return existing
     scene = _ensure_scene_state(session)
     summary = scene.get("summary")
@@ -817,12 +948,11 @@ def _ensure_scene_text(session: Any, character: Any, llm_client: OllamaClient) -
 
 
 def _build_scene_request(session: Any, character: Any) -> NarrationRequest:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     setting = metadata.get("setting") if isinstance(metadata.get("setting"), dict) else {}
     return NarrationRequest(
         state_summary={
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
+            **_session_context(session),
             "setting": setting,
             "character_id": getattr(character, "id", None),
             "scene_lock": _extract_scene_lock(session),
@@ -845,7 +975,7 @@ def _resolve_target_label(intent: Intent) -> str | None:
 
 
 def _build_session_state(session: Any) -> dict:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     settings = metadata.get("settings")
     return {"settings": settings if isinstance(settings, dict) else {}}
 
@@ -865,21 +995,14 @@ def _build_envelope_context(session: Any, payload: dict | None) -> dict:
     }
 
 
-_MEMORY_RECALL_CONFIG: dict | None = None
-
-
-def _load_memory_recall_config() -> dict:
-    global _MEMORY_RECALL_CONFIG
-    if _MEMORY_RECALL_CONFIG is not None:
-        return _MEMORY_RECALL_CONFIG
+@lru_cache(maxsize=1)
+def _load_memory_recall_config() -> Mapping[str, Any]:
     repo_root = Path(__file__).resolve().parents[2]
     config_path = repo_root / "docs" / "jsons" / "memory_recall.json"
     if not config_path.exists():
-        _MEMORY_RECALL_CONFIG = {}
-        return _MEMORY_RECALL_CONFIG
-    payload = json.loads(config_path.read_text(encoding="utf-8"))
-    _MEMORY_RECALL_CONFIG = payload if isinstance(payload, dict) else {}
-    return _MEMORY_RECALL_CONFIG
+        return MappingProxyType({})
+    payload = json.loads(config_path.read_bytes())
+    return MappingProxyType(payload if isinstance(payload, dict) else {})
 
 
 def _record_memory_recall_note(
@@ -891,7 +1014,7 @@ def _record_memory_recall_note(
     note_title: str | None,
     note_prefix: str | None,
 ) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     notes = metadata.get("gm_memory_notes")
     if not isinstance(notes, list):
         notes = []
@@ -906,43 +1029,78 @@ def _record_memory_recall_note(
     }
     notes.append(note_entry)
     metadata["gm_memory_notes"] = notes
-    session.metadata_json = metadata
 
 
 def _intent_to_turn_intent(intent: Intent) -> TurnIntent:
-    target_label = _resolve_target_label(intent)
-    if intent.action_type == "explore":
-        return TurnIntent(action="explore", actions_required=0)
-    if intent.action_type == "scene_request":
-        return TurnIntent(action="scene_request", actions_required=0)
-    if intent.action_type == "interact":
-        return TurnIntent(action="interact", actions_required=1, target_label=target_label)
-    if intent.action_type == "ask_gm":
-        return TurnIntent(action="ask_gm", actions_required=0)
-    if intent.action_type == "use_power":
-        return TurnIntent(
-            action="use_power",
-            power_id=intent.power_used,
-            actions_required=1,
-        )
-    if intent.action_type == "attack":
-        return TurnIntent(
-            action="attack",
-            target_ar=12,
-            weapon_damage="1d6",
-            actions_required=1,
-            target_label=target_label or "nearest_threat",
-        )
-    if intent.action_type == "move":
-        movement = intent.movement.model_dump() if intent.movement else None
-        return TurnIntent(action="move", actions_required=1, movement=movement)
-    if intent.action_type == "buy_item":
-        return TurnIntent(
-            action="buy_item",
-            item_used=intent.item_used,
-            actions_required=1,
-        )
-    return TurnIntent(action="pass", actions_required=0)
+    builder = _TURN_INTENT_BUILDERS.get(intent.action_type)
+    if builder is None:
+        return TurnIntent(action="pass", actions_required=0)
+    return builder(intent)
+
+
+def _turn_intent_explore(intent: Intent) -> TurnIntent:
+    return TurnIntent(action="explore", actions_required=0)
+
+
+def _turn_intent_scene_request(intent: Intent) -> TurnIntent:
+    return TurnIntent(action="scene_request", actions_required=0)
+
+
+def _turn_intent_interact(intent: Intent) -> TurnIntent:
+    return TurnIntent(
+        action="interact",
+        actions_required=1,
+        target_label=_resolve_target_label(intent),
+    )
+
+
+def _turn_intent_ask_gm(intent: Intent) -> TurnIntent:
+    return TurnIntent(action="ask_gm", actions_required=0)
+
+
+def _turn_intent_use_power(intent: Intent) -> TurnIntent:
+    return TurnIntent(
+        action="use_power",
+        power_id=intent.power_used,
+        actions_required=1,
+    )
+
+
+def _turn_intent_attack(intent: Intent) -> TurnIntent:
+    return TurnIntent(
+        action="attack",
+        target_ar=12,
+        weapon_damage="1d6",
+        actions_required=1,
+        target_label=_resolve_target_label(intent) or "nearest_threat",
+    )
+
+
+def _turn_intent_move(intent: Intent) -> TurnIntent:
+    movement = intent.movement.model_dump() if intent.movement else None
+    return TurnIntent(action="move", actions_required=1, movement=movement)
+
+
+def _turn_intent_buy_item(intent: Intent) -> TurnIntent:
+    return TurnIntent(
+        action="buy_item",
+        item_used=intent.item_used,
+        actions_required=1,
+    )
+
+
+_TURN_INTENT_BUILDERS: Mapping[str, Callable[[Intent], TurnIntent]] = MappingProxyType(
+    {
+        "explore": _turn_intent_explore,
+        "scene_request": _turn_intent_scene_request,
+        "interact": _turn_intent_interact,
+        "ask_gm": _turn_intent_ask_gm,
+        "use_power": _turn_intent_use_power,
+        "attack": _turn_intent_attack,
+        "move": _turn_intent_move,
+        "buy_item": _turn_intent_buy_item,
+    }
+)
 
 
 def _build_intent_context(session: Any, character: Any) -> dict:
@@ -981,16 +1139,22 @@ def _build_narration_request(
     character: Any,
     intent: Intent,
     outcome: dict,
+    *,
+    era_name: str,
+    location: str,
+    resources: dict,
 ) -> NarrationRequest:
-    return NarrationRequest(
+    # Built from the engine's own JSON-shaped state, so validation is skipped;
+    # the outcome is copied because the pipeline adds narration keys to it.
+    return NarrationRequest.model_construct(
         state_summary={
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
+            "era": era_name,
+            "location": location,
             "current_scene": _extract_scene_lock(session),
             "character_id": getattr(character, "id", None),
-            "resources": (character.attributes_json or {}).get("resources", {}),
+            "resources": resources,
         },
-        outcome=outcome,
+        outcome=dict(outcome),
         tone="grounded",
     )
 
@@ -1000,15 +1164,18 @@ def _build_death_request(
     character: Any,
     intent: Intent,
     outcome: dict,
+    *,
+    era_name: str,
+    location: str,
 ) -> NarrationRequest:
-    return NarrationRequest(
+    return NarrationRequest.model_construct(
         state_summary={
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
+            "era": era_name,
+            "location": location,
             "character_id": getattr(character, "id", None),
             "event": "death",
         },
-        outcome=outcome,
+        outcome=dict(outcome),
         tone="elegiac",
     )
 
@@ -1052,14 +1219,14 @@ def _clarify_turn_result(
     )
     narration = _build_scene_update(scene_text, suggested_actions)
     outcome = {"clarify": True, "message": question, "narration": narration}
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **_session_context(session),
+        "intent": intent_payload,
         "outcome": outcome,
     }
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome=outcome,
         state_diff={},
@@ -1080,6 +1247,8 @@ def _is_dead(state: dict) -> bool:
     hp = state.get("hp")
     if hp is None:
         return False
+    if isinstance(hp, int):
+        return hp <= 0
     try:
         return int(hp) <= 0
     except (TypeError, ValueError):
@@ -1088,11 +1257,11 @@ def _is_dead(state: dict) -> bool:
 
 def _build_character_state_diff(
     character: Any,
+    attributes: dict,
     resources: dict,
     outcome: dict,
 ) -> dict:
-    attributes = character.attributes_json or {}
-    derived = attributes.get("derived") if isinstance(attributes, dict) else {}
+    derived = attributes.get("derived")
     derived = derived if isinstance(derived, dict) else {}
     hp = derived.get("hp")
     ap = derived.get("ap")
@@ -1111,16 +1280,20 @@ def _build_scene_update(scene_text: str, suggested_actions: list[dict] | None =
     short_scene = _shorten_text(scene_text, limit=180)
     if not short_scene.endswith((".", "!", "?")):
         short_scene += "."
-    prompt = "Choose a next action from the options below."
-    return "\n".join(
-        [short_scene, "No immediate changes are evident.", prompt]
-        + _format_suggested_actions(suggested_actions)
-    )
+    parts = [
+        short_scene,
+        "No immediate changes are evident.",
+        "Choose a next action from the options below.",
+    ]
+    parts.extend(_format_suggested_actions(suggested_actions))
+    return "\n".join(parts)
 
 
-def _build_suggested_actions(available_actions: Iterable[str]) -> list[dict]:
-    action_set = {str(action) for action in available_actions or []}
-    candidates = [
+# Entries are copied on the way out; the nested payloads are shared and only
+# ever read (rendered into narration or serialised into the response).
+_SUGGESTED_ACTION_CANDIDATES: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(candidate)
+    for candidate in (
         {
             "label": "Explore the area",
             "action_type": "explore",
@@ -1151,40 +1324,42 @@ def _build_suggested_actions(available_actions: Iterable[str]) -> list[dict]:
             "action_type": "ask_gm",
             "payload": {"dialogue": "What stands out right now?"},
         },
-    ]
-    filtered = [item for item in candidates if item["action_type"] in action_set]
-    if len(filtered) < 3:
-        fallback = {"label": "Explore the area", "action_type": "explore", "payload": {}}
-        while len(filtered) < 3:
-            filtered.append(fallback)
-    return filtered[:5]
+    )
+)
+_FALLBACK_SUGGESTED_ACTION = _SUGGESTED_ACTION_CANDIDATES[0]
 
 
-def _format_suggested_actions(suggested_actions: list[dict] | None) -> list[str]:
+def _build_suggested_actions(available_actions: Iterable[str]) -> list[dict]:
+    # The intent context already carries a short list of plain strings; only
+    # other shapes need coercing into a set.
+    if isinstance(available_actions, (list, tuple)) and all(
+        type(action) is str for action in available_actions
+    ):
+        action_set: Collection[str] = available_actions
+    else:
+        action_set = {str(action) for action in available_actions or []}
+    filtered: list[dict] = []
+    for item in _SUGGESTED_ACTION_CANDIDATES:
+        if item["action_type"] in action_set:
+            filtered.append(dict(item))
+            if len(filtered) == 5:
+                break
+    while len(filtered) < 3:
+        filtered.append(dict(_FALLBACK_SUGGESTED_ACTION))
+    return filtered
+
+
+def _format_suggested_actions(suggested_actions: list[dict] | None) -> Iterator[str]:
     if not suggested_actions:
-        return []
-    lines = ["Available actions:"]
+        return
+    yield "Available actions:"
     for action in suggested_actions:
         label = action.get("label") or action.get("action_type") or "Action"
-        lines.append(f"- {label}")
-    return lines
+        yield f"- {label}"
 
 
 def _is_memory_recall_request(player_text: str) -> bool:
-    text = player_text.strip().lower()
-    if not text:
-        return False
-    triggers = (
-        "what do i know",
-        "what do we know",
-        "what do i remember",
-        "why am i here",
-        "didn't you say",
-        "did you say",
-        "what did you say",
-        "what do you remember",
-    )
-    return any(trigger in text for trigger in triggers)
+    return _MEMORY_RECALL_TRIGGERS.search(player_text) is not None
 
 
 def _memory_recall_result(
@@ -1196,7 +1371,7 @@ def _memory_recall_result(
     debug_info: dict,
     threads: list[Any],
 ) -> TurnResult:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     setup = metadata.get("session_setup") if isinstance(metadata.get("session_setup"), dict) else {}
     starting = setup.get("starting_situation") if isinstance(setup.get("starting_situation"), dict) else {}
     goal = starting.get("hook") or "Unknown"
@@ -1268,16 +1443,16 @@ def _memory_recall_result(
     ]
 
     intent = Intent(action_type="ask_gm", targets=[], dialogue="Memory recall.")
+    intent_payload = intent.model_dump()
+    context = _session_context(session)
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **context,
+        "intent": intent_payload,
         "outcome": {"memory_recall": True},
     }
     narration_request = NarrationRequest(
         state_summary={
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
+            **context,
             "memory_recall": recall_summary,
         },
         outcome={
@@ -1290,7 +1465,7 @@ def _memory_recall_result(
     if not narration:
         narration = "\n".join(lines)
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={
             "memory_recall": True,
@@ -1321,26 +1496,16 @@ def _recent_fact_lines(metadata: dict, limit: int = 4) -> list[str]:
     log = metadata.get("turn_log")
     if not isinstance(log, list) or not log:
         return []
-    recent = log[-limit:]
-    facts = []
-    for entry in recent:
-        line = _format_turn_entry(entry)
-        if line:
-            facts.append(line)
-    return facts
+    return list(filter(None, map(_format_turn_entry, log[-limit:])))
 
 
 def _collect_rumors(threads: list[Any], limit: int = 3) -> list[str]:
-    rumors = []
-    for thread in threads:
-        if getattr(thread, "type", "") != "rumor":
-            continue
-        text = getattr(thread, "text", "")
-        if text:
-            rumors.append(text)
-        if len(rumors) >= limit:
-            break
-    return rumors
+    rumor_texts = (
+        getattr(thread, "text", "")
+        for thread in threads
+        if getattr(thread, "type", "") == "rumor"
+    )
+    return list(islice(filter(None, rumor_texts), limit))
 
 
 def _rule_edge_case_result(
@@ -1351,10 +1516,11 @@ def _rule_edge_case_result(
     player_text: str,
     envelope: Any,
 ) -> TurnResult:
-    question = _build_rule_question(player_text, envelope)
-    affected_systems = _build_affected_systems(envelope)
+    primary, secondary = _classification_categories(envelope)
+    question = _build_rule_question(player_text, primary)
+    affected_systems = _build_affected_systems(primary, secondary)
     if _dev_mode_enabled(session):
-        proposal = _build_rule_proposal(envelope, question)
+        proposal = _build_rule_proposal(primary, question)
         narration = (
             "OOC: Mechanics edge case detected.\n"
             f"Question: {question}\n"
@@ -1384,14 +1550,14 @@ def _rule_edge_case_result(
             targets=[],
             dialogue="Please provide a ruling for this edge case.",
         )
+        intent_payload = intent.model_dump()
         narration_context = {
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
-            "intent": intent.model_dump(),
+            **_session_context(session),
+            "intent": intent_payload,
             "outcome": {"rule_edge_case": True},
         }
         return TurnResult(
-            intent=intent.model_dump(),
+            intent=intent_payload,
             rolls=[],
             outcome={"rule_edge_case": True, "proposal": proposal},
             state_diff={},
@@ -1425,14 +1591,14 @@ def _rule_edge_case_result(
         targets=[],
         dialogue="Proceed under conservative ruling.",
     )
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **_session_context(session),
+        "intent": intent_payload,
         "outcome": {"rule_edge_case": True},
     }
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={"rule_edge_case": True, "ruling_note": ruling_note},
         state_diff={},
@@ -1451,36 +1617,34 @@ def _rule_edge_case_result(
     )
 
 
-def _build_rule_question(player_text: str, envelope: Any) -> str:
-    summary = player_text.strip() if player_text else "Unspecified request"
+def _classification_categories(envelope: Any) -> tuple[Any, Any]:
     classification = getattr(envelope, "classification", None)
-    category = None
-    if classification:
-        category = getattr(classification, "primary_category", None)
-    if category:
-        return f"{summary} (category: {category})"
+    if not classification:
+        return None, None
+    return (
+        getattr(classification, "primary_category", None),
+        getattr(classification, "secondary_category", None),
+    )
+
+
+def _build_rule_question(player_text: str, primary: Any) -> str:
+    summary = player_text.strip() if player_text else "Unspecified request"
+    if primary:
+        return f"{summary} (category: {primary})"
     return summary
 
 
-def _build_affected_systems(envelope: Any) -> list[str]:
-    classification = getattr(envelope, "classification", None)
+def _build_affected_systems(primary: Any, secondary: Any) -> list[str]:
     systems = []
-    if classification:
-        primary = getattr(classification, "primary_category", None)
-        secondary = getattr(classification, "secondary_category", None)
-        if primary:
-            systems.append(str(primary))
-        if secondary:
-            systems.append(str(secondary))
+    if primary:
+        systems.append(str(primary))
+    if secondary:
+        systems.append(str(secondary))
     return systems or ["mechanics"]
 
 
-def _build_rule_proposal(envelope: Any, question: str) -> str:
-    category = None
-    classification = getattr(envelope, "classification", None)
-    if classification:
-        category = getattr(classification, "primary_category", None)
-    category_label = category or "mechanics"
+def _build_rule_proposal(primary: Any, question: str) -> str:
+    category_label = primary or "mechanics"
     return f"Add a rule entry for {category_label} edge cases: {question}"
 
 
@@ -1499,14 +1663,14 @@ def _content_gap_result(
             targets=[],
             dialogue="This system is missing. Do you want to proceed without it?",
         )
+        intent_payload = intent.model_dump()
         narration_context = {
-            "era": _extract_era_name(session),
-            "location": _extract_location(session),
-            "intent": intent.model_dump(),
+            **_session_context(session),
+            "intent": intent_payload,
             "outcome": {"content_gap": True},
         }
         return TurnResult(
-            intent=intent.model_dump(),
+            intent=intent_payload,
             rolls=[],
             outcome={"content_gap": True},
             state_diff={},
@@ -1543,9 +1707,10 @@ def _content_gap_result(
             clarification_questions=["System draft creation is unavailable."],
         )
 
-    draft_payload = _build_system_draft_payload(player_text, envelope)
+    primary, _ = _classification_categories(envelope)
+    draft_payload = _build_system_draft_payload(player_text, primary)
     try:
-        draft = SystemDraftSchema.model_validate(draft_payload)
+        draft = _validate_system_draft(draft_payload)
     except ValueError as exc:
         debug_info["validation_errors"].append(str(exc))
         return _clarify_turn_result(
@@ -1577,10 +1742,10 @@ def _content_gap_result(
         targets=[],
         dialogue="Do you want to activate this system draft?",
     )
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **_session_context(session),
+        "intent": intent_payload,
         "outcome": {"content_gap": True, "system_draft_created": True},
     }
     suggested_actions = [
@@ -1596,7 +1761,7 @@ def _content_gap_result(
         },
     ]
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={"content_gap": True, "system_draft": created},
         state_diff={},
@@ -1613,73 +1778,84 @@ def _content_gap_result(
     )
 
 
-def _build_system_draft_payload(player_text: str, envelope: Any) -> dict:
-    name = _infer_system_name(player_text, envelope)
-    if name.lower() == "alchemy":
-        return {
-            "name": "Alchemy",
-            "inputs": [
-                {
-                    "mechanic": "project",
-                    "description": "Gather alchemical reagents",
-                    "payload": {
-                        "type": "craft",
-                        "requirements": {"materials": ["reagents"]},
-                        "work_units_total": 2,
-                    },
-                }
-            ],
-            "process": [
-                {
-                    "mechanic": "roll",
-                    "description": "Perform an alchemy check",
-                    "payload": {"skill": "Alchemy", "dice": "1d20"},
-                }
-            ],
-            "outputs": [
-                {
-                    "mechanic": "project",
-                    "description": "Recipe: Minor Tonic",
-                    "payload": {
-                        "name": "Minor Tonic",
-                        "type": "craft",
-                        "requirements": {"materials": ["reagents", "solvent"]},
-                        "work_units_total": 3,
-                    },
-                },
-                {
-                    "mechanic": "project",
-                    "description": "Recipe: Smoke Bomb",
-                    "payload": {
-                        "name": "Smoke Bomb",
-                        "type": "craft",
-                        "requirements": {"materials": ["reagents", "ash"]},
-                        "work_units_total": 2,
-                    },
-                },
-            ],
-            "costs": [
-                {
-                    "mechanic": "status",
-                    "description": "Minor burns if mishandled",
-                    "payload": {"status": "Injured", "level": 1, "duration": 1},
-                }
-            ],
-            "risks": [
-                {
-                    "mechanic": "status",
-                    "description": "Toxic exposure on failure",
-                    "payload": {"status": "Toxin", "level": 1, "duration": 2},
-                }
-            ],
-            "checks": [
-                {
-                    "mechanic": "roll",
-                    "description": "Stability check",
-                    "payload": {"skill": "Alchemy", "dice": "1d20"},
-                }
-            ],
+_ALCHEMY_DRAFT: dict[str, Any] = {
+    "name": "Alchemy",
+    "inputs": [
+        {
+            "mechanic": "project",
+            "description": "Gather alchemical reagents",
+            "payload": {
+                "type": "craft",
+                "requirements": {"materials": ["reagents"]},
+                "work_units_total": 2,
+            },
+        }
+    ],
+    "process": [
+        {
+            "mechanic": "roll",
+            "description": "Perform an alchemy check",
+            "payload": {"skill": "Alchemy", "dice": "1d20"},
+        }
+    ],
+    "outputs": [
+        {
+            "mechanic": "project",
+            "description": "Recipe: Minor Tonic",
+            "payload": {
+                "name": "Minor Tonic",
+                "type": "craft",
+                "requirements": {"materials": ["reagents", "solvent"]},
+                "work_units_total": 3,
+            },
+        },
+        {
+            "mechanic": "project",
+            "description": "Recipe: Smoke Bomb",
+            "payload": {
+                "name": "Smoke Bomb",
+                "type": "craft",
+                "requirements": {"materials": ["reagents", "ash"]},
+                "work_units_total": 2,
+            },
+        },
+    ],
+    "costs": [
+        {
+            "mechanic": "status",
+            "description": "Minor burns if mishandled",
+            "payload": {"status": "Injured", "level": 1, "duration": 1},
+        }
+    ],
+    "risks": [
+        {
+            "mechanic": "status",
+            "description": "Toxic exposure on failure",
+            "payload": {"status": "Toxin", "level": 1, "duration": 2},
+        }
+    ],
+    "checks": [
+        {
+            "mechanic": "roll",
+            "description": "Stability check",
+            "payload": {"skill": "Alchemy", "dice": "1d20"},
         }
+    ],
+}
+
+_ALCHEMY_SYSTEM_DRAFT = SystemDraftSchema.model_validate(_ALCHEMY_DRAFT)
+
+
+def _validate_system_draft(payload: dict) -> SystemDraftSchema:
+    if payload is _ALCHEMY_DRAFT:
+        return _ALCHEMY_SYSTEM_DRAFT
+    return SystemDraftSchema.model_validate(payload)
+
+
+def _build_system_draft_payload(player_text: str, primary: Any) -> dict:
+    name = _infer_system_name(player_text, primary)
+    if name.lower() == "alchemy":
+        return _ALCHEMY_DRAFT
     return {
         "name": name,
         "inputs": [],
@@ -1691,15 +1867,12 @@ def _build_system_draft_payload(player_text: str, envelope: Any) -> dict:
     }
 
 
-def _infer_system_name(player_text: str, envelope: Any) -> str:
+def _infer_system_name(player_text: str, primary: Any) -> str:
     lowered = (player_text or "").strip().lower()
     if "alchemy" in lowered:
         return "Alchemy"
-    classification = getattr(envelope, "classification", None)
-    if classification:
-        primary = getattr(classification, "primary_category", None)
-        if isinstance(primary, str) and primary.strip():
-            return primary.strip().title()
+    if isinstance(primary, str) and primary.strip():
+        return primary.strip().title()
     return "New System"
 
 
@@ -1717,6 +1890,7 @@ def _exploration_result(
     tags = _extract_exploration_tags(session, player_text)
     gradient, index = _choose_truth_gradient(session, tags)
     summary = _build_discovery_summary(gradient, tags)
+    classification = getattr(envelope, "classification", None)
     discovery_payload = {
         "session_id": getattr(session, "id", None),
         "gradient": gradient,
@@ -1724,9 +1898,7 @@ def _exploration_result(
         "tags": tags,
         "context": {
             "player_text": player_text,
-            "classification": getattr(envelope, "classification", None).model_dump()
-            if getattr(envelope, "classification", None)
-            else None,
+            "classification": classification.model_dump() if classification else None,
         },
     }
     created_discovery = (
@@ -1743,11 +1915,11 @@ def _exploration_result(
         thread_creator(thread_payload) if thread_creator else thread_payload
     )
     _bump_exploration_index(session, index)
+    context = _session_context(session)
     narration = llm_client.generate_narration(
         NarrationRequest(
             state_summary={
-                "era": _extract_era_name(session),
-                "location": _extract_location(session),
+                **context,
                 "tags": tags,
                 "discovery": created_discovery,
             },
@@ -1756,14 +1928,14 @@ def _exploration_result(
         )
     )
     intent = Intent(action_type="explore", targets=[])
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **context,
+        "intent": intent_payload,
         "outcome": {"discovery": created_discovery, "thread": created_thread},
     }
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={
             "exploration": True,
@@ -1788,87 +1960,103 @@ def _exploration_result(
 
 
 def _extract_exploration_tags(session: Any, player_text: str) -> list[str]:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
-    tags: list[str] = []
-    for key in ("era", "location"):
-        value = metadata.get(key)
-        if isinstance(value, str) and value.strip():
-            tags.append(value.strip().lower())
-    setting = metadata.get("setting") if isinstance(metadata.get("setting"), dict) else {}
-    setting_type = setting.get("type")
-    if isinstance(setting_type, str) and setting_type.strip():
-        tags.append(setting_type.strip().lower())
+    metadata = _session_metadata(session)
+    setting = metadata.get("setting")
+    if not isinstance(setting, dict):
+        setting = {}
+    tags = {
+        value.strip().lower()
+        for value in (metadata.get("era"), metadata.get("location"), setting.get("type"))
+        if isinstance(value, str)
+    }
     tone_tags = setting.get("tone_tags")
     if isinstance(tone_tags, list):
-        tags.extend(
-            [str(tag).strip().lower() for tag in tone_tags if str(tag).strip()]
-        )
+        tags.update(str(tag).strip().lower() for tag in tone_tags)
     if player_text:
-        tags.extend(
-            [part.strip().lower() for part in player_text.split() if part.strip()]
-        )
-    return sorted({tag for tag in tags if tag})
+        tags.update(player_text.lower().split())
+    tags.discard("")
+    return sorted(tags)
+
+
+def _mix_seed(seed: int) -> int:
+    # One MurmurHash3 finalizer step: sequential seeds land on unrelated
+    # picks without seeding a Mersenne Twister for a single draw.
+    mixed = seed & _UINT64_MASK
+    mixed = ((mixed ^ (mixed >> 33)) * 0xFF51AFD7ED558CCD) & _UINT64_MASK
+    mixed = ((mixed ^ (mixed >> 33)) * 0xC4CEB9FE1A85EC53) & _UINT64_MASK
+    return mixed ^ (mixed >> 33)
 
 
 def _stable_hash_tags(tags: list[str]) -> int:
-    joined = "|".join(tags).encode("utf-8")
-    digest = hashlib.sha256(joined).hexdigest()
-    return int(digest[:8], 16)
+    return zlib.crc32("|".join(tags).encode("utf-8"))
+
+
+_TRUTH_GRADIENTS = ("myth", "partial", "lost", "false", "dangerous")
 
 
 def _choose_truth_gradient(session: Any, tags: list[str]) -> tuple[str, int]:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     exploration_index = int(metadata.get("exploration_index", 0))
     seed = (session.rng_seed or 0) + _stable_hash_tags(tags) + exploration_index
-    rng = random.Random(seed)
-    gradients = ["myth", "partial", "lost", "false", "dangerous"]
-    return gradients[rng.randrange(len(gradients))], exploration_index
+    gradient = _TRUTH_GRADIENTS[_mix_seed(seed) % len(_TRUTH_GRADIENTS)]
+    return gradient, exploration_index
 
 
 def _bump_exploration_index(session: Any, current_index: int) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     metadata["exploration_index"] = current_index + 1
-    session.metadata_json = metadata
 
 
-def _build_discovery_summary(gradient: str, tags: list[str]) -> str:
-    tag_hint = tags[0] if tags else "the area"
-    summaries = {
-        "myth": f"A legend surfaces about {tag_hint}, whispered but unproven.",
-        "partial": f"You uncover partial clues tied to {tag_hint}.",
-        "lost": f"The trail for {tag_hint} goes cold, hinting at a hidden path.",
-        "false": f"A false lead about {tag_hint} points elsewhere.",
-        "dangerous": f"A dangerous discovery in {tag_hint} hints at immediate threat.",
+_DISCOVERY_SUMMARIES: Mapping[str, str] = MappingProxyType(
+    {
+        "myth": "A legend surfaces about {tag}, whispered but unproven.",
+        "partial": "You uncover partial clues tied to {tag}.",
+        "lost": "The trail for {tag} goes cold, hinting at a hidden path.",
+        "false": "A false lead about {tag} points elsewhere.",
+        "dangerous": "A dangerous discovery in {tag} hints at immediate threat.",
     }
-    return summaries.get(gradient, "You uncover a lead worth following.")
-
+)
 
-def _build_thread_from_discovery(
-    session: Any,
-    discovery: dict,
-    gradient: str,
-) -> dict:
-    thread_type_map = {
+_DISCOVERY_THREAD_TYPES: Mapping[str, str] = MappingProxyType(
+    {
         "myth": "rumor",
         "partial": "hook",
         "lost": "foreshadow",
         "false": "rumor",
         "dangerous": "consequence",
     }
-    urgency_map = {
+)
+
+_DISCOVERY_URGENCIES: Mapping[str, str] = MappingProxyType(
+    {
         "myth": "low",
         "partial": "med",
         "lost": "low",
         "false": "low",
         "dangerous": "high",
     }
+)
+
+
+def _build_discovery_summary(gradient: str, tags: list[str]) -> str:
+    template = _DISCOVERY_SUMMARIES.get(gradient)
+    if template is None:
+        return "You uncover a lead worth following."
+    return template.format(tag=tags[0] if tags else "the area")
+
+
+def _build_thread_from_discovery(
+    session: Any,
+    discovery: dict,
+    gradient: str,
+) -> dict:
     summary = discovery.get("summary") or "A new lead emerges."
     text = f"{summary} Follow up to press the lead."
     return {
         "session_id": getattr(session, "id", None),
-        "type": thread_type_map.get(gradient, "hook"),
+        "type": _DISCOVERY_THREAD_TYPES.get(gradient, "hook"),
         "status": "open",
-        "urgency": urgency_map.get(gradient, "med"),
+        "urgency": _DISCOVERY_URGENCIES.get(gradient, "med"),
         "visibility": "player",
         "related_entities": {"discovery_id": discovery.get("id")},
         "text": text,
@@ -1889,21 +2077,25 @@ def _stagnation_result(
 ) -> TurnResult:
     open_threads = [thread for thread in threads if getattr(thread, "status", "") == "open"]
     active_clocks = [
-        clock for clock in clocks
-        if getattr(clock, "steps_done", 0) < getattr(clock, "steps_total", 0)
+        (clock, done, total)
+        for clock in clocks
+        if (done := getattr(clock, "steps_done", 0))
+        < (total := getattr(clock, "steps_total", 0))
     ]
-    preference_profile = _load_preference_profile(session)
-    action = _choose_stagnation_action(session, open_threads, active_clocks)
+    metadata = _ensure_session_metadata(session)
+    preference_profile = _load_preference_profile(metadata)
+    action = _choose_stagnation_action(session, metadata, open_threads, active_clocks)
     outcome = {"stagnation": True, "action": action}
 
     if action == "escalate_clock" and active_clocks:
-        clock = active_clocks[0]
-        clock.steps_done = min(clock.steps_total, clock.steps_done + 1)
+        clock, done, total = active_clocks[0]
+        done = min(total, done + 1)
+        clock.steps_done = done
         outcome["clock_escalated"] = {
             "id": getattr(clock, "id", None),
             "name": getattr(clock, "name", None),
-            "steps_done": clock.steps_done,
-            "steps_total": clock.steps_total,
+            "steps_done": done,
+            "steps_total": total,
         }
 
     if action == "thread_consequence" and open_threads:
@@ -1922,13 +2114,13 @@ def _stagnation_result(
     created_hook = thread_creator(hook_payload) if thread_creator else hook_payload
     outcome["hook"] = created_hook
 
-    _update_pacing_tag(session, "tension")
+    _update_pacing_tag(metadata, "tension")
 
+    context = _session_context(session)
     narration = llm_client.generate_narration(
         NarrationRequest(
             state_summary={
-                "era": _extract_era_name(session),
-                "location": _extract_location(session),
+                **context,
                 "preference_profile": preference_profile,
                 "stagnation_action": action,
             },
@@ -1937,14 +2129,14 @@ def _stagnation_result(
         )
     )
     intent = Intent(action_type="explore", targets=[])
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **context,
+        "intent": intent_payload,
         "outcome": outcome,
     }
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome=outcome,
         state_diff={},
@@ -1965,10 +2157,10 @@ def _stagnation_result(
 
 def _choose_stagnation_action(
     session: Any,
+    metadata: dict,
     open_threads: list[Any],
     active_clocks: list[Any],
 ) -> str:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
     stagnation_index = int(metadata.get("stagnation_index", 0))
     options = ["opportunity"]
     if active_clocks:
@@ -1976,15 +2168,12 @@ def _choose_stagnation_action(
     if open_threads:
         options.append("thread_consequence")
     seed = (session.rng_seed or 0) + stagnation_index + len(options) * 13
-    rng = random.Random(seed)
-    choice = options[rng.randrange(len(options))]
+    choice = options[_mix_seed(seed) % len(options)]
     metadata["stagnation_index"] = stagnation_index + 1
-    session.metadata_json = metadata
     return choice
 
 
-def _load_preference_profile(session: Any) -> dict:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+def _load_preference_profile(metadata: dict) -> dict:
     prefs = metadata.get("player_prefs")
     if isinstance(prefs, dict):
         return prefs
@@ -2021,10 +2210,9 @@ def _build_stagnation_hook(
     return base
 
 
-def _update_pacing_tag(session: Any, tag: str) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
-    metadata["pacing_tag"] = tag
-    session.metadata_json = metadata
+def _update_pacing_tag(metadata: dict, tag: str) -> None:
+    if metadata.get("pacing_tag") != tag:
+        metadata["pacing_tag"] = tag
 
 
 def _retcon_dispute_result(
@@ -2033,7 +2221,7 @@ def _retcon_dispute_result(
     intent_context: dict,
     debug_info: dict,
 ) -> TurnResult:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     citations = _build_turn_citations(metadata)
     rolling_summary = metadata.get("rolling_summary") or ""
     narration_parts = [
@@ -2073,14 +2261,14 @@ def _retcon_dispute_result(
         targets=[],
         dialogue="Which resolution should we apply?",
     )
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **_session_context(session),
+        "intent": intent_payload,
         "outcome": {"retcon_dispute": True},
     }
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={"retcon_dispute": True, "citations": citations},
         state_diff={},
@@ -2109,29 +2297,25 @@ def _build_turn_citations(metadata: dict, limit: int = 5) -> list[str]:
         total_turns = len(log)
     offset = max(0, total_turns - len(log))
     start_index = max(0, len(log) - limit)
-    citations = []
-    for idx in range(start_index, len(log)):
-        entry = log[idx]
-        turn_number = offset + idx + 1
-        line = _format_turn_entry(entry)
-        if line:
-            citations.append(f"Turn {turn_number}: {line}")
-    return citations
+    format_entry = _format_turn_entry
+    return [
+        f"Turn {turn_number}: {line}"
+        for turn_number, entry in enumerate(
+            log[start_index:], start=offset + start_index + 1
+        )
+        if (line := format_entry(entry))
+    ]
+
+
+_TURN_ENTRY_FIELDS = ("action", "power", "item")
 
 
 def _format_turn_entry(entry: dict) -> str:
     if not isinstance(entry, dict):
         return ""
-    parts: list[str] = []
-    action = entry.get("action")
-    if action:
-        parts.append(f"action={action}")
-    power = entry.get("power")
-    if power:
-        parts.append(f"power={power}")
-    item = entry.get("item")
-    if item:
-        parts.append(f"item={item}")
+    parts = [
+        f"{key}={value}" for key in _TURN_ENTRY_FIELDS if (value := entry.get(key))
+    ]
     outcome = entry.get("outcome")
     if isinstance(outcome, dict):
         if "hit" in outcome:
@@ -2142,7 +2326,7 @@ def _format_turn_entry(entry: dict) -> str:
 
 
 def _dev_mode_enabled(session: Any) -> bool:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _session_metadata(session)
     settings = metadata.get("settings")
     if isinstance(settings, dict):
         value = settings.get("dev_mode_enabled")
@@ -2166,7 +2350,7 @@ def _should_log_retcon(intent: Intent, session: Any) -> bool:
 
 
 def _log_retcon_event(session: Any, intent: Intent) -> None:
-    metadata = session.metadata_json if isinstance(session.metadata_json, dict) else {}
+    metadata = _ensure_session_metadata(session)
     retcon_log = metadata.get("retcon_log")
     if not isinstance(retcon_log, list):
         retcon_log = []
@@ -2177,7 +2361,6 @@ def _log_retcon_event(session: Any, intent: Intent) -> None:
         }
     )
     metadata["retcon_log"] = retcon_log
-    session.metadata_json = metadata
 
 
 def _maybe_store_ruling(db, outcome: dict) -> None:
@@ -2205,9 +2388,7 @@ def _update_player_profile(db, session: Any, intent_payload: dict) -> None:
     action_type = None
     if isinstance(intent_payload, dict):
         action_type = intent_payload.get("action_type") or intent_payload.get("action")
-    if not action_type:
-        return
-    if action_type in {"ask_clarifying_question", "invalid"}:
+    if action_type not in _ACTION_INTEREST_CATEGORIES:
         return
     profile = _get_or_create_profile(db, session)
     if profile is None:
@@ -2252,8 +2433,8 @@ def _default_interest_weights() -> dict:
     return {name: {"count": 0, "weight": 0.0} for name in categories}
 
 
-def _apply_interest_update(interests: dict, action_type: str) -> dict:
-    mapping = {
+_ACTION_INTEREST_CATEGORIES: Mapping[str, str] = MappingProxyType(
+    {
         "attack": "combat",
         "use_power": "combat",
         "buy_item": "crafting",
@@ -2264,26 +2445,21 @@ def _apply_interest_update(interests: dict, action_type: str) -> dict:
         "interact": "politics",
         "ask_gm": "mystery",
     }
-    category = mapping.get(action_type)
+)
+
+
+def _apply_interest_update(interests: dict, action_type: str) -> dict:
+    category = _ACTION_INTEREST_CATEGORIES.get(action_type)
     if category is None:
         return interests
     entry = interests.get(category)
     if not isinstance(entry, dict):
-        entry = {"count": 0, "weight": 0.0}
-    count = entry.get("count", 0)
-    weight = entry.get("weight", 0.0)
-    try:
-        count = int(count)
-    except (TypeError, ValueError):
-        count = 0
-    try:
-        weight = float(weight)
-    except (TypeError, ValueError):
-        weight = 0.0
-    count += 1
-    weight += 1.0
-    entry = {"count": count, "weight": weight}
-    interests[category] = entry
+        entry = {}
+    count = entry.get("count")
+    count = int(count) if isinstance(count, (int, float)) else 0
+    weight = entry.get("weight")
+    weight = float(weight) if isinstance(weight, (int, float)) else 0.0
+    interests[category] = {"count": count + 1, "weight": weight + 1.0}
     return interests
 
 
@@ -2338,8 +2514,7 @@ def _maybe_create_project(
         )
     questions = _project_questions(step)
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
+        **_session_context(session),
         "event": "project_created",
         "project": {"name": project_data.get("name"), "type": project_data.get("type")},
     }
@@ -2368,13 +2543,20 @@ def _maybe_create_project(
     )
 
 
+_PROJECT_STEP_TYPES = frozenset({"craft", "improvise"})
+_LONG_TIME_COSTS = frozenset({"hours", "days"})
+
+
 def _find_project_step(plan) -> Any | None:
-    for step in plan.root:
-        if step.type in {"craft", "improvise"}:
-            complexity = step.complexity or 0
-            if complexity > 1 or step.time_cost in {"hours", "days"}:
-                return step
-    return None
+    return next(
+        (
+            step
+            for step in plan.root
+            if step.type in _PROJECT_STEP_TYPES
+            and ((step.complexity or 0) > 1 or step.time_cost in _LONG_TIME_COSTS)
+        ),
+        None,
+    )
 
 
 def _build_project_payload(step, session: Any, character: Any) -> dict:
@@ -2429,18 +2611,17 @@ def _scene_intro_result(
         dialogue="Choose an action to proceed.",
         movement=None,
     )
+    intent_payload = intent.model_dump()
     narration_context = {
-        "era": _extract_era_name(session),
-        "location": _extract_location(session),
-        "intent": intent.model_dump(),
+        **_session_context(session),
+        "intent": intent_payload,
         "outcome": {"scene_established": True},
     }
-    narration = "\n".join(
-        [scene_text, "Choose a next action from the options below."]
-        + _format_suggested_actions(suggested_actions)
-    )
+    parts = [scene_text, "Choose a next action from the options below."]
+    parts.extend(_format_suggested_actions(suggested_actions))
+    narration = "\n".join(parts)
     return TurnResult(
-        intent=intent.model_dump(),
+        intent=intent_payload,
         rolls=[],
         outcome={"scene_established": True, "narration": narration},
         state_diff={},
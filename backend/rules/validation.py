@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Iterable
 
+_GUN_TAGS = frozenset({"gun", "firearm"})
+_GUN_RESTRICTED_ERAS = frozenset({"prehistoric", "medieval"})
+
 
 class ValidationError(ValueError):
     pass
@@ -16,7 +19,7 @@ def _normalize_era(era_name: str | None) -> str:
 def _has_gun_tag(tags: Iterable[str] | None) -> bool:
     if not tags:
         return False
-    return any(tag.strip().lower() in {"gun", "firearm"} for tag in tags)
+    return any(tag.strip().lower() in _GUN_TAGS for tag in tags)
 
 
 def _allow_guns_in_medieval(era_patch: dict | None) -> bool:
@@ -53,10 +56,10 @@ def validate_weapon_allowed(
     weapon_tags: Iterable[str] | None,
     era_patch: dict | None = None,
 ) -> None:
-    if not _has_gun_tag(weapon_tags):
+    era = _normalize_era(era_name)
+    if era not in _GUN_RESTRICTED_ERAS or not _has_gun_tag(weapon_tags):
         return
 
-    era = _normalize_era(era_name)
     if era == "prehistoric":
         raise ValidationError("Guns are not allowed in the Prehistoric era.")
     if era == "medieval":
@@ -0,0 +1,53 @@
+"""add session lookup indexes
+
+Revision ID: 0016_add_session_indexes
+Revises: 0015_add_player_profile
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "0016_add_session_indexes"
+down_revision = "0015_add_player_profile"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_characters_session_id", "characters", ["session_id"]),
+    ("ix_projects_session_id_id", "projects", ["session_id", "id"]),
+    ("ix_npcs_session_id_id", "npcs", ["session_id", "id"]),
+    ("ix_clocks_session_id_id", "clocks", ["session_id", "id"]),
+    ("ix_threads_session_id_id", "threads", ["session_id", "id"]),
+    (
+        "ix_memory_cards_session_entity",
+        "memory_cards",
+        ["session_id", "entity_type", "entity_id"],
+    ),
+    ("ix_player_profile_session_id", "player_profile", ["session_id"]),
+    ("ix_entity_links_from", "entity_links", ["from_type", "from_id", "id"]),
+    ("ix_entity_links_to", "entity_links", ["to_type", "to_id", "id"]),
+    ("ix_secrets_owner", "secrets", ["owner_type", "owner_id", "id"]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,9 +1,12 @@
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy.dialects.postgresql import insert
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 sys.path = [path for path in sys.path if Path(path).resolve() != SCRIPT_DIR]
 
@@ -27,6 +30,24 @@ from models import (  # noqa: E402
 )
 
 JSON_DIR = REPO_ROOT / "docs" / "jsons"
+SUPER_POWER_FILES = (
+    "sherlock.json",
+    "teleportation.json",
+    "power_drain.json",
+    "superspeed.json",
+)
+SEED_FILES = (
+    "races.json",
+    "professions.json",
+    "skills.json",
+    "trainings.json",
+    "leveling.json",
+    "statuses.json",
+    "eras.json",
+    "armor.json",
+    "weapons.json",
+    *SUPER_POWER_FILES,
+)
 
 
 def load_json(file_name: str) -> Any | None:
@@ -38,6 +59,11 @@ def load_json(file_name: str) -> Any | None:
         return json.load(handle)
 
 
+def load_seed_files(file_names: tuple[str, ...]) -> dict[str, Any]:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(file_names, executor.map(load_json, file_names)))
+
+
 def strip_fields(payload: dict, *keys: str) -> dict:
     data = dict(payload)
     for key in keys:
@@ -45,92 +71,97 @@ def strip_fields(payload: dict, *keys: str) -> dict:
     return data
 
 
-def upsert_by_name(session, model, name: str, **fields: Any) -> None:
-    exists = session.query(model).filter_by(name=name).first()
-    if exists:
+def insert_missing_by_name(session, model, rows: list[dict]) -> None:
+    if not rows:
         return
-    session.add(model(name=name, **fields))
+    session.execute(
+        insert(model).values(rows).on_conflict_do_nothing(index_elements=["name"])
+    )
 
 
-def seed_races(session) -> None:
-    data = load_json("races.json")
+def seed_races(session, data: Any) -> None:
     if not isinstance(data, list):
         return
+    rows = []
     for item in data:
         if not isinstance(item, dict) or "name" not in item:
             continue
         attributes = strip_fields(item, "name", "description")
-        upsert_by_name(
-            session,
-            Race,
-            item["name"],
-            description=item.get("description"),
-            attributes_json=attributes or None,
+        rows.append(
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "attributes_json": attributes or None,
+            }
         )
+    insert_missing_by_name(session, Race, rows)
 
 
-def seed_professions(session) -> None:
-    data = load_json("professions.json")
+def seed_professions(session, data: Any) -> None:
     if not isinstance(data, list):
         return
+    rows = []
     for item in data:
         if not isinstance(item, dict) or "name" not in item:
             continue
         attributes = strip_fields(item, "name", "description")
-        upsert_by_name(
-            session,
-            Profession,
-            item["name"],
-            description=item.get("description"),
-            attributes_json=attributes or None,
+        rows.append(
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "attributes_json": attributes or None,
+            }
         )
+    insert_missing_by_name(session, Profession, rows)
 
 
-def seed_skills(session) -> None:
-    data = load_json("skills.json")
+def seed_skills(session, data: Any) -> None:
     if not isinstance(data, list):
         return
+    rows = []
     for item in data:
         if not isinstance(item, dict) or "name" not in item:
             continue
         definition = strip_fields(item, "name", "description")
-        upsert_by_name(
-            session,
-            Skill,
-            item["name"],
-            description=item.get("description"),
-            definition_json=definition or None,
+        rows.append(
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "definition_json": definition or None,
+            }
         )
+    insert_missing_by_name(session, Skill, rows)
 
 
-def seed_trainings(session) -> None:
-    data = load_json("trainings.json")
+def seed_trainings(session, data: Any) -> None:
     if not isinstance(data, list):
         return
+    rows = []
     for item in data:
         if not isinstance(item, dict) or "name" not in item:
             continue
         details = strip_fields(item, "name", "description")
-        upsert_by_name(
-            session,
-            Training,
-            item["name"],
-            description=item.get("description"),
-            skill_levels_json=details or None,
+        rows.append(
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "skill_levels_json": details or None,
+            }
         )
+    insert_missing_by_name(session, Training, rows)
 
 
-def seed_leveling(session) -> None:
-    data = load_json("leveling.json")
+def seed_leveling(session, data: Any) -> None:
     if not isinstance(data, list):
         return
+    existing = {level for (level,) in session.query(Leveling.level)}
     for item in data:
         if not isinstance(item, dict) or "level" not in item:
             continue
         level = item["level"]
-        exists = session.query(Leveling).filter_by(level=level).first()
-        if exists:
+        if level in existing:
             continue
+        existing.add(level)
         details = strip_fields(item, "level", "description")
         session.add(
             Leveling(
@@ -142,22 +173,23 @@ def seed_leveling(session) -> None:
         )
 
 
-def seed_statuses(session) -> None:
-    data = load_json("statuses.json")
+def seed_statuses(session, data: Any) -> None:
     if not isinstance(data, dict):
         return
+    rows = []
     for key, payload in data.items():
         if not isinstance(payload, dict):
             continue
         description = payload.get("description")
         progression = strip_fields(payload, "description")
-        upsert_by_name(
-            session,
-            Status,
-            key,
-            description=description,
-            progression_json=progression or None,
+        rows.append(
+            {
+                "name": key,
+                "description": description,
+                "progression_json": progression or None,
+            }
         )
+    insert_missing_by_name(session, Status, rows)
 
 
 def extract_era_payload(item: dict) -> tuple[dict | None, dict | None]:
@@ -184,13 +216,13 @@ def extract_era_payload(item: dict) -> tuple[dict | None, dict | None]:
     return profile, patches
 
 
-def seed_eras(session) -> None:
-    data = load_json("eras.json")
+def seed_eras(session, data: Any) -> None:
     if not data:
         return
     items = data if isinstance(data, list) else data.get("eras")
     if not isinstance(items, list):
         return
+    rows = []
     for item in items:
         if not isinstance(item, dict):
             continue
@@ -198,89 +230,90 @@ def seed_eras(session) -> None:
         if not name:
             continue
         profile_json, patch_json = extract_era_payload(item)
-        upsert_by_name(
-            session,
-            Era,
-            name,
-            description=item.get("description"),
-            profile_json=profile_json,
-            patch_json=patch_json,
+        rows.append(
+            {
+                "name": name,
+                "description": item.get("description"),
+                "profile_json": profile_json,
+                "patch_json": patch_json,
+            }
         )
+    insert_missing_by_name(session, Era, rows)
 
 
-def seed_armor(session) -> None:
-    data = load_json("armor.json")
+def seed_armor(session, data: Any) -> None:
     if not isinstance(data, dict):
         return
+    rows = []
     for payload in data.values():
         if not isinstance(payload, dict):
             continue
         name = payload.get("name")
         if not name:
             continue
-        upsert_by_name(
-            session,
-            ArmorBase,
-            name,
-            armor_rating=payload.get("armorRating"),
-            stats_json=payload,
+        rows.append(
+            {
+                "name": name,
+                "armor_rating": payload.get("armorRating"),
+                "stats_json": payload,
+            }
         )
+    insert_missing_by_name(session, ArmorBase, rows)
 
 
-def seed_weapons(session) -> None:
-    data = load_json("weapons.json")
+def seed_weapons(session, data: Any) -> None:
     if not isinstance(data, dict):
         return
+    rows = []
     for payload in data.values():
         if not isinstance(payload, dict):
             continue
         name = payload.get("name")
         if not name:
             continue
-        upsert_by_name(
-            session,
-            WeaponBase,
-            name,
-            damage=payload.get("damage"),
-            damage_type=payload.get("damageType"),
-            stats_json=payload,
+        rows.append(
+            {
+                "name": name,
+                "damage": payload.get("damage"),
+                "damage_type": payload.get("damageType"),
+                "stats_json": payload,
+            }
         )
+    insert_missing_by_name(session, WeaponBase, rows)
 
 
-def seed_super_powers(session) -> None:
-    for file_name in (
-        "sherlock.json",
-        "teleportation.json",
-        "power_drain.json",
-        "superspeed.json",
-    ):
-        payload = load_json(file_name)
+def seed_super_powers(session, payloads: dict[str, Any]) -> None:
+    rows = []
+    for file_name in SUPER_POWER_FILES:
+        payload = payloads.get(file_name)
         if not isinstance(payload, dict):
             continue
         name = payload.get("school") or payload.get("name")
         if not name:
             name = Path(file_name).stem.replace("_", " ").title()
-        upsert_by_name(
-            session,
-            SuperPower,
-            name,
-            description=payload.get("description"),
-            definition_json=payload,
+        rows.append(
+            {
+                "name": name,
+                "description": payload.get("description"),
+                "definition_json": payload,
+            }
         )
+    insert_missing_by_name(session, SuperPower, rows)
 
 
 def main() -> None:
+    payloads = load_seed_files(SEED_FILES)
     with SessionLocal() as session:
-        seed_races(session)
-        seed_professions(session)
-        seed_skills(session)
-        seed_trainings(session)
-        seed_leveling(session)
-        seed_statuses(session)
-        seed_eras(session)
-        seed_armor(session)
-        seed_weapons(session)
-        seed_super_powers(session)
+        seed_races(session, payloads["races.json"])
+        seed_professions(session, payloads["professions.json"])
+        seed_skills(session, payloads["skills.json"])
+        seed_trainings(session, payloads["trainings.json"])
+        seed_leveling(session, payloads["leveling.json"])
+        seed_statuses(session, payloads["statuses.json"])
+        seed_eras(session, payloads["eras.json"])
+        seed_armor(session, payloads["armor.json"])
+        seed_weapons(session, payloads["weapons.json"])
+        seed_super_powers(session, payloads)
         session.commit()
 
 
@@ -1,5 +1,8 @@
-from rules.combat import CombatantState, Weapon, resolve_attack
+from dataclasses import replace
+
+from rules.combat import CombatantState, Weapon, resolve_attack, roll_initiative
 from rules.core import SessionState
+from rules.statuses import apply_status
 
 
 def test_hit_and_miss() -> None:
@@ -167,3 +170,16 @@ def test_counter_reaction_triggers_basic_strike() -> None:
     assert result.counter is not None
     assert result.counter.triggered is True
     assert updated_attacker.hp == 4
+
+
+def test_initiative_uses_current_dex_and_statuses() -> None:
+    combatant = CombatantState(name="Runner", dex=5, armor_rating=10, ap=0, hp=10)
+    baseline = roll_initiative(SessionState(seed=3), combatant)
+
+    chilled = replace(
+        combatant, statuses=apply_status(combatant.statuses, "Cold", level=3)
+    )
+    assert roll_initiative(SessionState(seed=3), chilled) == baseline - 3
+
+    combatant.dex = 1
+    assert roll_initiative(SessionState(seed=3), combatant) == baseline - 4
@@ -2,7 +2,13 @@ from types import SimpleNamespace
 
 import pytest
 
-from rules.economy import EconomyError, is_item_legal_for_era, quote_item_price, validate_credit_spend
+from rules.economy import (
+    EconomyError,
+    add_item_to_gear,
+    is_item_legal_for_era,
+    quote_item_price,
+    validate_credit_spend,
+)
 
 
 def test_buying_succeeds_with_enough_credits() -> None:
@@ -22,6 +28,16 @@ def test_buying_fails_with_insufficient_credits() -> None:
         validate_credit_spend(gear_pack, 10)
 
 
+def test_add_item_does_not_mutate_input_gear_pack() -> None:
+    gear_pack = {"credits": 5, "items": [{"base": "Knife"}]}
+    updated = add_item_to_gear(gear_pack, {"base": "Rope"})
+
+    assert [item["base"] for item in updated["items"]] == ["Knife", "Rope"]
+    assert gear_pack["items"] == [{"base": "Knife"}]
+    updated["items"][0]["base"] = "Spear"
+    assert gear_pack["items"][0]["base"] == "Knife"
+
+
 def test_era_locked_item() -> None:
     allowed = is_item_legal_for_era("Space", "Plasma Pistol", ["plasma"])
     blocked = is_item_legal_for_era("Medieval", "Plasma Pistol", ["plasma"])
@@ -1,6 +1,7 @@
 import json
 
-from llm.client import _intent_messages
+from llm.client import OllamaClient, _intent_messages, _narration_messages
+from llm.schemas import NarrationRequest
 
 
 def test_intent_prompt_includes_required_context_fields() -> None:
@@ -20,3 +21,56 @@ def test_intent_prompt_includes_required_context_fields() -> None:
     assert payload["context"]["era"] == "Space"
     assert payload["context"]["available_actions"] == ["attack", "move"]
     assert payload["context"]["available_powers"] == ["sherlock.scanning_gaze"]
+
+
+def test_narration_prompt_keeps_scene_context_in_stable_prefix() -> None:
+    def request(scene: dict, outcome: dict) -> NarrationRequest:
+        return NarrationRequest(
+            state_summary={"era": "Space", "current_scene": scene, "resources": {}},
+            outcome=outcome,
+        )
+
+    first = _narration_messages(request({"summary": "Dock", "established": True}, {"hit": True}))
+    second = _narration_messages(request({"established": True, "summary": "Dock"}, {"hit": False}))
+    assert first[0] == second[0]
+    assert '"era": "Space"' in first[0]["content"]
+
+    payload = json.loads(first[1]["content"])
+    assert payload["outcome"] == {"hit": True}
+    assert payload["state_summary"] == {"resources": {}}
+
+
+def test_narration_prompt_keeps_non_ascii_text_unescaped() -> None:
+    messages = _narration_messages(
+        NarrationRequest(
+            state_summary={"location": "Café Zürich", "note": "señal débil"},
+            outcome={"hit": True},
+        )
+    )
+    assert "Café Zürich" in messages[0]["content"]
+    assert "señal débil" in messages[1]["content"]
+    assert "\\u" not in messages[0]["content"] + messages[1]["content"]
+
+
+def test_repeated_intent_extraction_reuses_cached_intent(monkeypatch) -> None:
+    calls = []
+
+    def fake_chat(self, **kwargs):
+        calls.append(kwargs)
+        return '{"action_type": "attack", "targets": []}'
+
+    monkeypatch.setattr(OllamaClient, "_chat", fake_chat)
+    client = OllamaClient(model="test")
+    context = {"era": "Space", "available_actions": ["attack"]}
+
+    first, _ = client.extract_intent_with_debug("attack  the guard", context)
+    second = client.extract_intent(" attack the guard", context)
+    assert first == second
+    assert len(calls) == 1
+    assert calls[0]["temperature"] == 0
+
+    client.extract_intent("attack the guard", {"era": "Medieval", "available_actions": ["attack"]})
+    assert len(calls) == 2
+
+    OllamaClient(model="test").extract_intent("attack the guard", context)
+    assert len(calls) == 3
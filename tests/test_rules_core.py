@@ -1,4 +1,6 @@
-from rules.core import SessionState, roll, roll_d20
+import pytest
+
+from rules.core import DiceSpec, SessionState, parse_dice, roll, roll_d20, roll_spec
 
 
 def test_deterministic_rolls_with_seed() -> None:
@@ -27,3 +29,35 @@ def test_roll_logging() -> None:
     assert second["formula"] == "2d4+1"
     assert second["result"] == dice_result
     assert second["label"] == "damage"
+
+
+def test_roll_log_respects_limit() -> None:
+    session = SessionState(seed=7, log_limit=2)
+
+    roll_d20(session, label="first")
+    roll_d20(session, label="second")
+    roll(session, "1d6", label="third")
+
+    assert [entry["label"] for entry in session.turn_log] == ["second", "third"]
+
+
+def test_roll_count_tracks_individual_dice() -> None:
+    session = SessionState(seed=5, log_limit=1)
+
+    roll_d20(session)
+    roll(session, "3d6")
+    roll(session, "4")
+
+    assert session.roll_count == 4
+
+
+def test_parsed_dice_spec_matches_string_roll() -> None:
+    assert parse_dice(" 2D6+3 ") == DiceSpec(formula="2D6+3", count=2, sides=6, modifier=3)
+    assert parse_dice("4") == DiceSpec(formula="4", count=0, sides=0, modifier=4)
+    with pytest.raises(ValueError):
+        parse_dice("0d6")
+
+    first = SessionState(seed=77)
+    second = SessionState(seed=77)
+    assert roll(first, "2d6+3") == roll_spec(second, parse_dice("2d6+3"))
+    assert list(first.turn_log) == list(second.turn_log)
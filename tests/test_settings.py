@@ -7,7 +7,7 @@ def test_generate_location_name_deterministic() -> None:
         setting_type="space station",
         seed=42,
     )
-    assert name == "Nova Station"
+    assert name == "Helix Station"
 
 
 def test_generate_location_name_varies_by_type() -> None:
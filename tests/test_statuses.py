@@ -1,4 +1,6 @@
 from rules.statuses import (
+    _tick_statuses_inplace,
+    apply_many_then_tick,
     apply_status,
     ramp_status,
     tick_statuses,
@@ -27,6 +29,28 @@ def test_cold_reduces_dex() -> None:
     assert total_dex_penalty(statuses) == 3
 
 
+def test_cold_penalty_handles_empty_and_uncanonical_entries() -> None:
+    assert total_dex_penalty({"Cold": {}}) == 1
+    assert total_dex_penalty({"cold": {"level": 2}}) == 2
+    assert total_dex_penalty({"COLD": {"level": 2}, "Stun": {}}) == 2
+    assert total_dex_penalty({" cold": {"level": 2}}) == 2
+
+
+def test_stored_string_and_float_values_are_coerced() -> None:
+    applied = apply_status({"Toxin": {"stacks": "2", "level": 1.0, "duration": "1"}}, "Toxin")
+    assert applied["Toxin"] == {"stacks": 3, "level": 1, "duration": 3}
+
+    ramped = ramp_status({"Bleeding": {"stacks": "1", "level": "1"}}, "Bleeding", trigger="move")
+    assert ramped["Bleeding"] == {"stacks": 2, "level": 2, "duration": 3}
+
+
+def test_ramp_without_handler_keeps_existing_empty_entry() -> None:
+    assert ramp_status({"Stun": {}}, "Stun", trigger="unknown") == {"Stun": {}}
+    assert ramp_status({}, "Stun", trigger="unknown") == {
+        "Stun": {"stacks": 1, "level": 1, "duration": None}
+    }
+
+
 def test_disease_escalates_over_days() -> None:
     statuses = apply_status({}, "Disease", level=1)
     updated, hp_delta, _ = tick_statuses(statuses, tick_type="day")
@@ -38,3 +62,34 @@ def test_asphyxiation_tick_damage() -> None:
     statuses = apply_status({}, "Asphyxiation", level=2, duration=2)
     _, hp_delta, _ = tick_statuses(statuses, tick_type="turn")
     assert hp_delta == -4
+
+
+def test_tick_does_not_mutate_input_statuses() -> None:
+    statuses = {"Bleeding": {"stacks": 1, "level": 1, "duration": 2}}
+    updated, _, _ = tick_statuses(statuses)
+
+    assert updated["Bleeding"]["duration"] == 1
+    assert statuses["Bleeding"]["duration"] == 2
+
+
+def test_inplace_tick_mutates_owned_map_only() -> None:
+    entry = {"stacks": 1, "level": 1, "duration": 2}
+    statuses = {"Toxin": entry}
+
+    hp_delta, expired = _tick_statuses_inplace(statuses)
+
+    assert hp_delta == -1
+    assert expired == ()
+    assert statuses["Toxin"]["duration"] == 1
+    assert entry["duration"] == 2
+
+
+def test_apply_many_then_tick_matches_sequential_calls() -> None:
+    applications = [("Bleeding", {}), ("Toxin", {"level": 2}), ("Stun", {})]
+
+    statuses: dict = {}
+    for name, options in applications:
+        statuses = apply_status(statuses, name, **options)
+    expected = tick_statuses(statuses)
+
+    assert apply_many_then_tick({}, applications) == expected
@@ -2,7 +2,15 @@ from types import SimpleNamespace
 
 from gm_os.protocols import ProtocolId
 from llm.schemas import Intent, TurnEnvelope
-from rules.turn import execute_turn_for_state
+from rules.core import SessionState
+from rules.turn import (
+    _build_suggested_actions,
+    _consume_rolls,
+    _is_memory_recall_request,
+    _shorten_text,
+    _validate_impossible_action,
+    execute_turn_for_state,
+)
 
 
 class StubLlmClient:
@@ -465,6 +473,9 @@ def test_integration_turn_updates_state_and_log(monkeypatch) -> None:
 
     assert result.state_diff["character"]["resources"]["actions"] == 0
     assert isinstance(session.metadata_json.get("turn_log"), list)
+    logged_rolls = session.metadata_json["turn_log"][-1]["rolls"]
+    assert logged_rolls
+    assert all(set(entry) == {"f", "r"} for entry in logged_rolls)
     assert session.metadata_json.get("turn_index") == 1
 
 
@@ -567,3 +578,81 @@ def test_memory_recall_records_gm_notes() -> None:
     assert isinstance(notes, list)
     assert notes
     assert notes[0]["verification_questions"] is not None
+
+
+def test_death_turn_requests_narration_and_journal() -> None:
+    session = SimpleNamespace(
+        rng_seed=2,
+        metadata_json={
+            "era": "Space",
+            "location": "Test",
+            "roll_index": 0,
+            "scene_text": "Test scene.",
+        },
+    )
+    character = SimpleNamespace(
+        attributes_json={"derived": {"hp": 0, "ap": 0}},
+        statuses_json={},
+    )
+    client = TrackingNarrationClient()
+
+    result = execute_turn_for_state(
+        session,
+        character,
+        "attack",
+        llm_client=client,
+        intent_override=Intent(action_type="attack", targets=[]),
+    )
+
+    assert result.outcome["death"] is True
+    assert result.outcome["death_journal"] == "LLM narration."
+    assert result.narration == "LLM narration."
+    assert [request.tone for request in client.narration_calls] == ["grounded", "elegiac"]
+    assert client.narration_calls[1].outcome["narration"] == "LLM narration."
+
+
+def test_consume_rolls_matches_sequential_draws() -> None:
+    expected = SessionState(seed=11)
+    for _ in range(250):
+        expected.rng.random()
+    advanced = SessionState(seed=11)
+    _consume_rolls(advanced, 250)
+
+    assert advanced.rng.getstate() == expected.rng.getstate()
+
+
+def test_spaceship_keywords_blocked_outside_space_era() -> None:
+    intent = Intent(action_type="explore", targets=[], dialogue="Board the StarShip!")
+    assert _validate_impossible_action(intent, "Medieval", None)
+    assert _validate_impossible_action(intent, "Space", None) is None
+    assert _validate_impossible_action(intent, "Medieval", "my spaceships") is not None
+    plain = Intent(action_type="explore", targets=[])
+    assert _validate_impossible_action(plain, "Medieval", "look at the stars") is None
+
+
+def test_shorten_text_collapses_whitespace_and_truncates() -> None:
+    assert _shorten_text("  a \n b\t c  ") == "a b c"
+    assert _shorten_text("word " * 100, limit=12) == "word word wo..."
+    assert _shorten_text("abcdef ghi", limit=10) == "abcdef ghi"
+
+
+def test_memory_recall_triggers_match_case_insensitively() -> None:
+    assert _is_memory_recall_request("So... What do I KNOW about the vault?")
+    assert _is_memory_recall_request("didn't you say the gate was open")
+    assert not _is_memory_recall_request("what do you know")
+    assert not _is_memory_recall_request("   ")
+
+
+def test_suggested_actions_cap_and_fallback() -> None:
+    every_action = ["explore", "interact", "move", "attack", "scene_request", "ask_gm"]
+    assert [item["action_type"] for item in _build_suggested_actions(every_action)] == [
+        "explore",
+        "interact",
+        "move",
+        "attack",
+        "scene_request",
+    ]
+    fallback = _build_suggested_actions(iter(["attack"]))
+    assert [item["action_type"] for item in fallback] == ["attack", "explore", "explore"]
+    fallback[1]["label"] = "changed"
+    assert _build_suggested_actions(None)[0]["label"] == "Explore the area"